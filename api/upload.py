@@ -6,7 +6,6 @@ import os
 import sys
 from pathlib import Path
 import base64
-import tempfile
 
 # Add parent directory to path to import mindtrace modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -82,14 +81,9 @@ def handler(req):
         file_data = base64.b64decode(body['file'])
         filename = body.get('filename', 'data.csv')
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp:
-            tmp.write(file_data)
-            tmp_path = tmp.name
-        
-        # Load data
+        # Load data straight from the decoded bytes (no temporary file)
         loader = DataLoader()
-        data = loader.load_file(tmp_path)
+        data = loader.load_bytes(file_data, os.path.splitext(filename)[1])
         
         # Store user data (in production, use a database)
         user_data[username] = {
@@ -100,9 +94,6 @@ def handler(req):
             'report': None
         }
         
-        # Clean up temp file
-        os.unlink(tmp_path)
-        
         # Return immediately - processing will be done via separate endpoint
         # This prevents timeout issues on Vercel (10s limit on free tier)
         print(f"[UPLOAD] File uploaded successfully for user: {username}", file=sys.stderr, flush=True)
@@ -16,6 +16,7 @@ from .action_router import ActionRouter
 class MindTraceAgent:
     def __init__(self, config):
         self.config = config
+        self.fs = config['eeg_processing']['sampling_rate']
         self.cleaner = EEGCleaner(config['eeg_processing'])
         self.analyzer = EEGAnalyzer(config['eeg_processing']['sampling_rate'])
         self.evaluator = PipelineEvaluator(config['eeg_processing']['sampling_rate'])
@@ -43,14 +44,27 @@ class MindTraceAgent:
         self.raw_data = None
         self.cleaned_data = None
         self.evaluation_results = None
+        # Analysis of the current raw/cleaned pair, reused until either array is replaced
+        self.last_analysis = None
+        self._last_analysis_source = (None, None)
+        # Validation only looks at raw_data, so it is reused until raw_data is replaced
+        self._validation = None
+        self._validation_source = None
+        # Rendered evaluation report for the evaluation_results object it came from
+        self._evaluation_report = None
+        self._evaluation_report_source = None
 
     def load_data(self, data):
         self.raw_data = data
         print("Data loaded.")
 
     def validate_data(self):
+        if self._validation is not None and self._validation_source is self.raw_data:
+            return self._validation
         report = self.validator.validate(self.raw_data)
         print(f"Validation Report: {report}")
+        self._validation = report
+        self._validation_source = self.raw_data
         return report
 
     def initial_clean(self):
@@ -74,13 +88,26 @@ class MindTraceAgent:
 
     async def save_results(self, path="cleaned_data.npy"):
         if self.cleaned_data is not None:
-            await self.tools.save_dataset(self.cleaned_data, path)
+            # float32 is well beyond the precision of the recording; halves the file size
+            await self.tools.save_dataset(np.asarray(self.cleaned_data).astype(np.float32, copy=False), path)
+
+    def analyze_current(self):
+        """Analyze the current raw/cleaned data, reusing the last result if neither array changed."""
+        source = (self.raw_data, self.cleaned_data)
+        if self.last_analysis is None or any(a is not b for a, b in zip(source, self._last_analysis_source)):
+            self.set_last_analysis(self.analyzer.analyze(self.raw_data, self.cleaned_data))
+        return self.last_analysis
+
+    def set_last_analysis(self, analysis_results):
+        """Record analysis results as belonging to the current raw/cleaned data."""
+        self.last_analysis = analysis_results
+        self._last_analysis_source = (self.raw_data, self.cleaned_data)
 
     def generate_explanation(self):
         # 1. Analyze the cleaned data to extract meaningful insights
         if self.raw_data is not None and self.cleaned_data is not None:
             print("[MindTrace] Analyzing cleaned EEG data...")
-            analysis_results = self.analyzer.analyze(self.raw_data, self.cleaned_data)
+            analysis_results = self.analyze_current()
             print(f"[MindTrace] Analysis complete - {analysis_results.get('dominant_band', 'unknown')} dominant")
         else:
             # Fallback if no data available
@@ -155,4 +182,11 @@ class MindTraceAgent:
         """Generate a human-readable evaluation report."""
         if self.evaluation_results is None:
             self.run_evaluation()
-        return self.evaluator.generate_evaluation_report(self.evaluation_results)
+        return self.render_evaluation_report(self.evaluation_results)
+
+    def render_evaluation_report(self, results):
+        """Render an evaluation report, reusing the last rendering for the same results."""
+        if results is None or results is not self._evaluation_report_source:
+            self._evaluation_report = self.evaluator.generate_evaluation_report(results)
+            self._evaluation_report_source = results
+        return self._evaluation_report
@@ -48,14 +48,13 @@ async def main():
         print("No file provided. Generating synthetic demo data...")
         # Simulate loading data (10 seconds of 256Hz EEG data)
         fs = config['eeg_processing']['sampling_rate']
-        t = np.linspace(0, 10, 10 * fs)
-        # Signal + Noise + Blink
-        signal = np.sin(2 * np.pi * 10 * t) # 10Hz Alpha
-        noise = np.random.normal(0, 0.5, len(t))
-        blink = np.zeros_like(t)
-        blink[500:550] = 150 # Blink at ~2s
-        
-        raw_data = signal + noise + blink
+        # float32, matching what DataLoader returns for real recordings
+        t = np.linspace(0, 10, 10 * fs, dtype=np.float32)
+        # Signal + Noise + Blink, accumulated in place
+        raw_data = np.sin(np.float32(2 * np.pi * 10) * t) # 10Hz Alpha
+        rng = np.random.default_rng(42) # Fixed seed so demo runs are reproducible
+        raw_data += np.float32(0.5) * rng.standard_normal(len(t), dtype=np.float32)
+        raw_data[500:550] += 150 # Blink at ~2s
         
     agent.load_data(raw_data)
     
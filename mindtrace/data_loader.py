@@ -1,6 +1,12 @@
+import io
 import numpy as np
 import os
 import pandas as pd
+try:
+    import pyarrow  # noqa: F401 - enables pandas' multi-threaded pyarrow CSV engine
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
 
 class DataLoader:
     def __init__(self):
@@ -14,21 +20,34 @@ class DataLoader:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         ext = os.path.splitext(file_path)[1].lower()
-        
+        return self._load(file_path, ext)
+
+    def load_bytes(self, data, suffix):
+        """
+        Loads EEG data from in-memory file contents, without staging them on disk.
+        `suffix` is the original file extension: '.npy' is loaded as a NumPy array,
+        anything else (including no extension) is parsed as CSV.
+        """
+        ext = '.npy' if suffix.lower() == '.npy' else '.csv'
+        return self._load(io.BytesIO(data), ext)
+
+    def _load(self, source, ext):
+        # Samples are returned as float32: ample precision for EEG amplitudes at
+        # half the memory of pandas' default float64.
         try:
             if ext == '.npy':
-                data = np.load(file_path)
+                data = np.load(source, allow_pickle=False)
                 # Ensure 1D array for single channel demo, or handle multi-channel
                 if data.ndim > 1:
                     print(f"Warning: Multi-channel data detected ({data.shape}). Using first channel.")
-                    return data[0]
-                return data
+                    return data[0].astype(np.float32)
+                return data.astype(np.float32, copy=False)
             
             elif ext == '.csv':
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(source, engine=CSV_ENGINE)
                 # Assume first column is data if no headers, or look for specific columns
                 print(f"Loaded CSV with columns: {df.columns.tolist()}")
-                return df.iloc[:, 0].values
+                return df.iloc[:, 0].to_numpy(dtype=np.float32)
             
             else:
                 raise ValueError(f"Unsupported file format: {ext}")
@@ -3,10 +3,14 @@ Database module for storing upload history and analysis results.
 Supports both SQLite (development) and PostgreSQL (production).
 """
 import os
-import json
+import threading
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+import orjson
+
 # Check if DATABASE_URL is set (PostgreSQL) or use SQLite
 DATABASE_URL = os.getenv('DATABASE_URL')
 
@@ -15,6 +19,7 @@ if DATABASE_URL and DATABASE_URL.startswith('postgresql'):
     try:
         import psycopg2
         from psycopg2.extras import RealDictCursor
+        from psycopg2.pool import ThreadedConnectionPool
         USE_POSTGRES = True
     except ImportError:
         print("[Database] Warning: psycopg2 not installed. Install with: pip install psycopg2-binary")
@@ -27,21 +32,134 @@ else:
 # SQLite database path (fallback)
 DB_PATH = Path(__file__).parent.parent / "mindtrace_data.db"
 
+# Chunk size used when reading a staged upload to compress it for its BLOB column
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uploaded files (mostly CSV text) are stored zlib-compressed; the `compression`
+# column records this so rows written before it was added still read back as-is.
+UPLOAD_COMPRESSION = 'zlib'
+UPLOAD_COMPRESSION_LEVEL = 3
+
+# Connection reuse: a bounded pool for PostgreSQL, one connection per thread for SQLite
+PG_POOL_MIN_SIZE = 1
+PG_POOL_MAX_SIZE = 10
+# Seconds to wait for a free pooled connection before giving up
+PG_POOL_TIMEOUT = 30
+_pg_pool = None
+_pg_pool_lock = threading.Lock()
+# ThreadedConnectionPool.getconn raises PoolError when every connection is out
+# rather than waiting, so checkouts first wait for one of these slots
+_pg_pool_slots = threading.BoundedSemaphore(PG_POOL_MAX_SIZE)
+_sqlite_local = threading.local()
+# Every per-thread SQLite connection, so they can all be closed on shutdown
+_sqlite_connections = []
+_sqlite_connections_lock = threading.Lock()
+
+# Analysis rows by id, with band_powers/full_results still as JSON text so every
+# caller decodes its own copy. Rows only change through rename_analysis and
+# delete_analysis, which evict their entry.
+_ANALYSIS_CACHE: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+_ANALYSIS_CACHE_MAXSIZE = 256
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
+class _PooledConnection:
+    """
+    Thin proxy around a reusable connection. close() rolls back anything
+    uncommitted and hands the connection back instead of closing it.
+
+    Use it as a context manager: leaving the block rolls back on error and
+    always hands the connection back.
+    """
+
+    def __init__(self, conn, release):
+        self._conn = conn
+        self._release = release
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                conn.rollback()
+            finally:
+                self._release(conn)
+
+
+def _get_pg_pool():
+    """Create the PostgreSQL connection pool on first use."""
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = ThreadedConnectionPool(PG_POOL_MIN_SIZE, PG_POOL_MAX_SIZE, DATABASE_URL)
+    return _pg_pool
+
+
+def _release_pg_connection(pool, conn):
+    """Return a connection to the PostgreSQL pool it came from and free its checkout slot."""
+    try:
+        pool.putconn(conn)
+    finally:
+        _pg_pool_slots.release()
+
+
+def close_connections():
+    """Close the PostgreSQL pool and all per-thread SQLite connections (on app shutdown)."""
+    global _pg_pool
+    with _pg_pool_lock:
+        if _pg_pool is not None:
+            _pg_pool.closeall()
+            _pg_pool = None
+    with _sqlite_connections_lock:
+        for conn in _sqlite_connections:
+            conn.close()
+        _sqlite_connections.clear()
+
+
+def _dumps(value) -> str:
+    """Serialise a JSON column value in one pass (numpy scalars/arrays included)."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
 
 def get_connection():
     """Get database connection with row factory for dict-like access."""
     if USE_POSTGRES and DATABASE_URL:
-        # PostgreSQL connection
-        conn = psycopg2.connect(DATABASE_URL)
-        return conn
+        # PostgreSQL connection, borrowed from the pool (waiting for a free one)
+        if not _pg_pool_slots.acquire(timeout=PG_POOL_TIMEOUT):
+            raise RuntimeError(
+                f"Timed out after {PG_POOL_TIMEOUT}s waiting for a free database connection"
+            )
+        try:
+            pool = _get_pg_pool()
+            conn = pool.getconn()
+        except Exception:
+            _pg_pool_slots.release()
+            raise
+        return _PooledConnection(conn, lambda _conn: _release_pg_connection(pool, _conn))
     else:
-        # SQLite connection
-        import sqlite3
-        # Ensure directory exists
-        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.row_factory = sqlite3.Row
-        return conn
+        # SQLite connection, reused for the lifetime of the calling thread
+        conn = getattr(_sqlite_local, 'conn', None)
+        if conn is None:
+            import sqlite3
+            # Ensure directory exists
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Only this thread uses it; check_same_thread=False lets shutdown close it
+            conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            _sqlite_local.conn = conn
+            with _sqlite_connections_lock:
+                _sqlite_connections.append(conn)
+        return _PooledConnection(conn, lambda _conn: None)
 
 
 def _get_cursor(conn):
@@ -60,100 +178,129 @@ def _row_to_dict(row):
         return dict(row) if row else None
 
 
-def init_db():
-    """Initialise database tables if they don't exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    if USE_POSTGRES:
-        # PostgreSQL syntax
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS analyses (
-                id SERIAL PRIMARY KEY,
-                filename TEXT NOT NULL,
-                name TEXT,
-                file_hash TEXT,
-                upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                file_size_bytes INTEGER,
-                num_channels INTEGER,
-                num_samples INTEGER,
-                duration_seconds REAL,
-                snr_improvement REAL,
-                noise_reduction_percent REAL,
-                dominant_band TEXT,
-                artefacts_detected INTEGER,
-                band_powers TEXT,
-                overall_score REAL,
-                signal_preservation REAL,
-                full_results TEXT,
-                raw_data_path TEXT,
-                cleaned_data_path TEXT,
-                status TEXT DEFAULT 'completed'
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_uploads (
-                id SERIAL PRIMARY KEY,
-                username TEXT NOT NULL UNIQUE,
-                filename TEXT NOT NULL,
-                file_data BYTEA NOT NULL,
-                file_size_bytes INTEGER NOT NULL,
-                file_hash TEXT,
-                upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_uploads_username 
-            ON user_uploads(username)
-        """)
-    else:
-        # SQLite syntax
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS analyses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                filename TEXT NOT NULL,
-                name TEXT,
-                file_hash TEXT,
-                upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                file_size_bytes INTEGER,
-                num_channels INTEGER,
-                num_samples INTEGER,
-                duration_seconds REAL,
-                snr_improvement REAL,
-                noise_reduction_percent REAL,
-                dominant_band TEXT,
-                artefacts_detected INTEGER,
-                band_powers TEXT,
-                overall_score REAL,
-                signal_preservation REAL,
-                full_results TEXT,
-                raw_data_path TEXT,
-                cleaned_data_path TEXT,
-                status TEXT DEFAULT 'completed'
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_uploads (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL UNIQUE,
-                filename TEXT NOT NULL,
-                file_data BLOB NOT NULL,
-                file_size_bytes INTEGER NOT NULL,
-                file_hash TEXT,
-                upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+def _decode_analysis(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an analysis row with its JSON columns parsed."""
+    record = dict(record)
+    if record.get('band_powers'):
+        record['band_powers'] = orjson.loads(record['band_powers'])
+    if record.get('full_results'):
+        record['full_results'] = orjson.loads(record['full_results'])
+    return record
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_uploads_username 
-            ON user_uploads(username)
-        """)
 
-    conn.commit()
-    conn.close()
+def init_db():
+    """Initialise database tables if they don't exist."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+
+        if USE_POSTGRES:
+            # PostgreSQL syntax
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS analyses (
+                    id SERIAL PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    name TEXT,
+                    file_hash TEXT,
+                    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    file_size_bytes INTEGER,
+                    num_channels INTEGER,
+                    num_samples INTEGER,
+                    duration_seconds REAL,
+                    snr_improvement REAL,
+                    noise_reduction_percent REAL,
+                    dominant_band TEXT,
+                    artefacts_detected INTEGER,
+                    band_powers TEXT,
+                    overall_score REAL,
+                    signal_preservation REAL,
+                    full_results TEXT,
+                    raw_data_path TEXT,
+                    cleaned_data_path TEXT,
+                    status TEXT DEFAULT 'completed'
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_uploads (
+                    id SERIAL PRIMARY KEY,
+                    username TEXT NOT NULL UNIQUE,
+                    filename TEXT NOT NULL,
+                    file_data BYTEA NOT NULL,
+                    file_size_bytes INTEGER NOT NULL,
+                    file_hash TEXT,
+                    compression TEXT,
+                    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                ALTER TABLE user_uploads ADD COLUMN IF NOT EXISTS compression TEXT
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_user_uploads_username 
+                ON user_uploads(username)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_analyses_file_hash
+                ON analyses(file_hash)
+            """)
+        else:
+            # SQLite syntax
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS analyses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    filename TEXT NOT NULL,
+                    name TEXT,
+                    file_hash TEXT,
+                    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    file_size_bytes INTEGER,
+                    num_channels INTEGER,
+                    num_samples INTEGER,
+                    duration_seconds REAL,
+                    snr_improvement REAL,
+                    noise_reduction_percent REAL,
+                    dominant_band TEXT,
+                    artefacts_detected INTEGER,
+                    band_powers TEXT,
+                    overall_score REAL,
+                    signal_preservation REAL,
+                    full_results TEXT,
+                    raw_data_path TEXT,
+                    cleaned_data_path TEXT,
+                    status TEXT DEFAULT 'completed'
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_uploads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT NOT NULL UNIQUE,
+                    filename TEXT NOT NULL,
+                    file_data BLOB NOT NULL,
+                    file_size_bytes INTEGER NOT NULL,
+                    file_hash TEXT,
+                    compression TEXT,
+                    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("PRAGMA table_info(user_uploads)")
+            if 'compression' not in {column[1] for column in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE user_uploads ADD COLUMN compression TEXT")
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_user_uploads_username 
+                ON user_uploads(username)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_analyses_file_hash
+                ON analyses(file_hash)
+            """)
+
+        conn.commit()
     db_type = "PostgreSQL" if USE_POSTGRES else "SQLite"
     print(f"[Database] Initialised successfully ({db_type})")
 
@@ -184,11 +331,60 @@ def save_analysis(
     Returns:
         The ID of the inserted record.
     """
-    conn = get_connection()
+    with get_connection() as conn:
+        record_id = _insert_analysis(
+            conn,
+            filename=filename,
+            name=name,
+            file_hash=file_hash,
+            file_size_bytes=file_size_bytes,
+            num_channels=num_channels,
+            num_samples=num_samples,
+            duration_seconds=duration_seconds,
+            snr_improvement=snr_improvement,
+            noise_reduction_percent=noise_reduction_percent,
+            dominant_band=dominant_band,
+            artefacts_detected=artefacts_detected,
+            band_powers=band_powers,
+            overall_score=overall_score,
+            signal_preservation=signal_preservation,
+            full_results=full_results,
+            raw_data_path=raw_data_path,
+            cleaned_data_path=cleaned_data_path,
+            status=status
+        )
+        conn.commit()
+
+    print(f"[Database] Saved analysis #{record_id} for {filename}")
+    return record_id
+
+
+def _insert_analysis(
+    conn,
+    filename: str,
+    name: Optional[str] = None,
+    file_hash: Optional[str] = None,
+    file_size_bytes: Optional[int] = None,
+    num_channels: Optional[int] = None,
+    num_samples: Optional[int] = None,
+    duration_seconds: Optional[float] = None,
+    snr_improvement: Optional[float] = None,
+    noise_reduction_percent: Optional[float] = None,
+    dominant_band: Optional[str] = None,
+    artefacts_detected: Optional[int] = None,
+    band_powers: Optional[Dict] = None,
+    overall_score: Optional[float] = None,
+    signal_preservation: Optional[float] = None,
+    full_results: Optional[Dict] = None,
+    raw_data_path: Optional[str] = None,
+    cleaned_data_path: Optional[str] = None,
+    status: str = 'completed'
+) -> int:
+    """INSERT an analysis row on an open connection without committing. Returns its ID."""
     cursor = conn.cursor()
 
-    band_powers_json = json.dumps(band_powers) if band_powers else None
-    full_results_json = json.dumps(full_results) if full_results else None
+    band_powers_json = _dumps(band_powers) if band_powers else None
+    full_results_json = _dumps(full_results) if full_results else None
 
     if USE_POSTGRES:
         cursor.execute("""
@@ -222,10 +418,6 @@ def save_analysis(
         ))
         record_id = cursor.lastrowid
 
-    conn.commit()
-    conn.close()
-
-    print(f"[Database] Saved analysis #{record_id} for {filename}")
     return record_id
 
 
@@ -239,38 +431,73 @@ def get_all_analyses(limit: int = 50) -> List[Dict[str, Any]]:
     Returns:
         List of analysis records as dictionaries.
     """
-    conn = get_connection()
-    cursor = _get_cursor(conn)
-
-    if USE_POSTGRES:
-        cursor.execute("""
-            SELECT * FROM analyses
-            ORDER BY upload_time DESC
-            LIMIT %s
-        """, (limit,))
-    else:
-        cursor.execute("""
-            SELECT * FROM analyses
-            ORDER BY upload_time DESC
-            LIMIT ?
-        """, (limit,))
-
-    rows = cursor.fetchall()
-    conn.close()
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
+
+        if USE_POSTGRES:
+            cursor.execute("""
+                SELECT * FROM analyses
+                ORDER BY upload_time DESC
+                LIMIT %s
+            """, (limit,))
+        else:
+            cursor.execute("""
+                SELECT * FROM analyses
+                ORDER BY upload_time DESC
+                LIMIT ?
+            """, (limit,))
+
+        rows = cursor.fetchall()
 
     results = []
     for row in rows:
         record = _row_to_dict(row)
         # Parse JSON fields
         if record.get('band_powers'):
-            record['band_powers'] = json.loads(record['band_powers'])
+            record['band_powers'] = orjson.loads(record['band_powers'])
         if record.get('full_results'):
-            record['full_results'] = json.loads(record['full_results'])
+            record['full_results'] = orjson.loads(record['full_results'])
         results.append(record)
 
     return results
 
 
+def get_analysis_summaries(limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Get the columns shown in the analysis history, most recent first.
+
+    Unlike get_all_analyses this skips the band_powers/full_results JSON,
+    which is by far the largest part of each row.
+
+    Args:
+        limit: Maximum number of records to return.
+
+    Returns:
+        List of analysis summaries as dictionaries.
+    """
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
+
+        if USE_POSTGRES:
+            cursor.execute("""
+                SELECT id, upload_time, name, filename, dominant_band, snr_improvement, overall_score
+                FROM analyses
+                ORDER BY upload_time DESC
+                LIMIT %s
+            """, (limit,))
+        else:
+            cursor.execute("""
+                SELECT id, upload_time, name, filename, dominant_band, snr_improvement, overall_score
+                FROM analyses
+                ORDER BY upload_time DESC
+                LIMIT ?
+            """, (limit,))
+
+        rows = cursor.fetchall()
+
+    return [_row_to_dict(row) for row in rows]
+
+
 def get_analysis_by_id(analysis_id: int) -> Optional[Dict[str, Any]]:
     """
     Get a specific analysis by ID.
@@ -281,28 +508,85 @@ def get_analysis_by_id(analysis_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         Analysis record as dictionary, or None if not found.
     """
-    conn = get_connection()
-    cursor = _get_cursor(conn)
+    with _ANALYSIS_CACHE_LOCK:
+        record = _ANALYSIS_CACHE.get(analysis_id)
+        if record is not None:
+            _ANALYSIS_CACHE.move_to_end(analysis_id)
+    if record is not None:
+        return _decode_analysis(record)
 
-    if USE_POSTGRES:
-        cursor.execute("SELECT * FROM analyses WHERE id = %s", (analysis_id,))
-    else:
-        cursor.execute("SELECT * FROM analyses WHERE id = ?", (analysis_id,))
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
 
-    row = cursor.fetchone()
-    conn.close()
+        if USE_POSTGRES:
+            cursor.execute("SELECT * FROM analyses WHERE id = %s", (analysis_id,))
+        else:
+            cursor.execute("SELECT * FROM analyses WHERE id = ?", (analysis_id,))
+
+        row = cursor.fetchone()
 
     if row:
         record = _row_to_dict(row)
-        if record.get('band_powers'):
-            record['band_powers'] = json.loads(record['band_powers'])
-        if record.get('full_results'):
-            record['full_results'] = json.loads(record['full_results'])
-        return record
+        _cache_analysis(record)
+        return _decode_analysis(record)
 
     return None
 
 
+def get_analysis_by_hash(file_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the most recent completed analysis of a file with the given content hash.
+
+    Args:
+        file_hash: Hex digest of the uploaded file.
+
+    Returns:
+        Analysis record as dictionary, or None if the file hasn't been analysed.
+    """
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
+
+        if USE_POSTGRES:
+            cursor.execute("""
+                SELECT * FROM analyses
+                WHERE file_hash = %s AND status = 'completed'
+                ORDER BY id DESC
+                LIMIT 1
+            """, (file_hash,))
+        else:
+            cursor.execute("""
+                SELECT * FROM analyses
+                WHERE file_hash = ? AND status = 'completed'
+                ORDER BY id DESC
+                LIMIT 1
+            """, (file_hash,))
+
+        row = cursor.fetchone()
+
+    if row:
+        # The row is keyed by id in the cache, so later get_analysis_by_id calls reuse it
+        record = _row_to_dict(row)
+        _cache_analysis(record)
+        return _decode_analysis(record)
+
+    return None
+
+
+def _cache_analysis(record: Dict[str, Any]) -> None:
+    """Cache an undecoded analysis row by its id, evicting the least recently used."""
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE[record['id']] = record
+        _ANALYSIS_CACHE.move_to_end(record['id'])
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAXSIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
+
+def _evict_cached_analysis(analysis_id: int) -> None:
+    """Drop a cached analysis row after it has been modified or removed."""
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE.pop(analysis_id, None)
+
+
 def get_statistics() -> Dict[str, Any]:
     """
     Get aggregate statistics from all analyses.
@@ -310,23 +594,22 @@ def get_statistics() -> Dict[str, Any]:
     Returns:
         Dictionary with statistics.
     """
-    conn = get_connection()
-    cursor = _get_cursor(conn)
-
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total_analyses,
-            AVG(snr_improvement) as avg_snr_improvement,
-            AVG(noise_reduction_percent) as avg_noise_reduction,
-            AVG(overall_score) as avg_overall_score,
-            SUM(file_size_bytes) as total_data_processed,
-            MAX(upload_time) as last_analysis
-        FROM analyses
-        WHERE status = 'completed'
-    """)
-
-    row = cursor.fetchone()
-    conn.close()
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
+
+        cursor.execute("""
+            SELECT
+                COUNT(*) as total_analyses,
+                AVG(snr_improvement) as avg_snr_improvement,
+                AVG(noise_reduction_percent) as avg_noise_reduction,
+                AVG(overall_score) as avg_overall_score,
+                SUM(file_size_bytes) as total_data_processed,
+                MAX(upload_time) as last_analysis
+            FROM analyses
+            WHERE status = 'completed'
+        """)
+
+        row = cursor.fetchone()
 
     return _row_to_dict(row) if row else {}
 
@@ -342,18 +625,18 @@ def rename_analysis(analysis_id: int, name: str) -> bool:
     Returns:
         True if renamed, False if not found.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-    if USE_POSTGRES:
-        cursor.execute("UPDATE analyses SET name = %s WHERE id = %s", (name, analysis_id))
-    else:
-        cursor.execute("UPDATE analyses SET name = ? WHERE id = ?", (name, analysis_id))
+        if USE_POSTGRES:
+            cursor.execute("UPDATE analyses SET name = %s WHERE id = %s", (name, analysis_id))
+        else:
+            cursor.execute("UPDATE analyses SET name = ? WHERE id = ?", (name, analysis_id))
 
-    updated = cursor.rowcount > 0
+        updated = cursor.rowcount > 0
 
-    conn.commit()
-    conn.close()
+        conn.commit()
+    _evict_cached_analysis(analysis_id)
 
     return updated
 
@@ -368,18 +651,18 @@ def delete_analysis(analysis_id: int) -> bool:
     Returns:
         True if deleted, False if not found.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-    if USE_POSTGRES:
-        cursor.execute("DELETE FROM analyses WHERE id = %s", (analysis_id,))
-    else:
-        cursor.execute("DELETE FROM analyses WHERE id = ?", (analysis_id,))
+        if USE_POSTGRES:
+            cursor.execute("DELETE FROM analyses WHERE id = %s", (analysis_id,))
+        else:
+            cursor.execute("DELETE FROM analyses WHERE id = ?", (analysis_id,))
 
-    deleted = cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
 
-    conn.commit()
-    conn.close()
+        conn.commit()
+    _evict_cached_analysis(analysis_id)
 
     return deleted
 
@@ -387,8 +670,9 @@ def delete_analysis(analysis_id: int) -> bool:
 def save_user_upload(
     username: str,
     filename: str,
-    file_data: bytes,
-    file_hash: Optional[str] = None
+    file_data: Optional[bytes] = None,
+    file_hash: Optional[str] = None,
+    file_path: Optional[str] = None
 ) -> int:
     """
     Save a user's uploaded CSV file to the database.
@@ -397,60 +681,97 @@ def save_user_upload(
         username: Unique username identifier
         filename: Original filename
         file_data: File contents as bytes
-        file_hash: Optional MD5 hash of the file
+        file_hash: Optional SHA-256 hex digest of the file
+        file_path: Path to the file on disk, used instead of file_data so the
+            contents are compressed a chunk at a time rather than read whole
         
     Returns:
         The ID of the inserted record.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    
+    if file_data is None and file_path is None:
+        raise ValueError("Either file_data or file_path must be provided")
+
+    file_size = len(file_data) if file_data is not None else os.path.getsize(file_path)
+
     # If file_hash not provided, calculate it
     if file_hash is None:
         import hashlib
-        file_hash = hashlib.md5(file_data).hexdigest()
+        if file_data is not None:
+            file_hash = hashlib.sha256(file_data).hexdigest()
+        else:
+            with open(file_path, 'rb') as f:
+                file_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+
+    with get_connection() as conn:
+        record_id = _insert_user_upload(conn, username, filename, file_data, file_path, file_size, file_hash)
+        conn.commit()
     
+    print(f"[Database] Saved upload for user '{username}': {filename} ({file_size} bytes)")
+    return record_id
+
+
+def _compress_upload(file_data, file_path) -> bytes:
+    """
+    Compress an upload's contents for storage. Files on disk are compressed a chunk
+    at a time, so only the compressed result is ever held in memory.
+    """
+    if file_data is not None:
+        return zlib.compress(file_data, UPLOAD_COMPRESSION_LEVEL)
+
+    compressor = zlib.compressobj(UPLOAD_COMPRESSION_LEVEL)
+    chunks = []
+    with open(file_path, 'rb') as src:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+
+
+def _insert_user_upload(conn, username, filename, file_data, file_path, file_size, file_hash) -> int:
+    """Upsert a user's upload on an open connection without committing. Returns its ID."""
+    cursor = conn.cursor()
+    stored_data = _compress_upload(file_data, file_path)
+
     if USE_POSTGRES:
         # PostgreSQL: Use ON CONFLICT for upsert
         cursor.execute("""
             INSERT INTO user_uploads (
-                username, filename, file_data, file_size_bytes, file_hash
-            ) VALUES (%s, %s, %s, %s, %s)
+                username, filename, file_data, file_size_bytes, file_hash, compression
+            ) VALUES (%s, %s, %s, %s, %s, %s)
             ON CONFLICT (username) 
             DO UPDATE SET 
                 filename = EXCLUDED.filename,
                 file_data = EXCLUDED.file_data,
                 file_size_bytes = EXCLUDED.file_size_bytes,
                 file_hash = EXCLUDED.file_hash,
+                compression = EXCLUDED.compression,
                 upload_time = CURRENT_TIMESTAMP
             RETURNING id
         """, (
             username,
             filename,
-            psycopg2.Binary(file_data),  # PostgreSQL BYTEA
-            len(file_data),
-            file_hash
+            psycopg2.Binary(stored_data),  # PostgreSQL BYTEA
+            file_size,
+            file_hash,
+            UPLOAD_COMPRESSION
         ))
         record_id = cursor.fetchone()[0]
     else:
         # SQLite: Use INSERT OR REPLACE
         cursor.execute("""
             INSERT OR REPLACE INTO user_uploads (
-                username, filename, file_data, file_size_bytes, file_hash
-            ) VALUES (?, ?, ?, ?, ?)
+                username, filename, file_data, file_size_bytes, file_hash, compression
+            ) VALUES (?, ?, ?, ?, ?, ?)
         """, (
             username,
             filename,
-            file_data,  # SQLite BLOB
-            len(file_data),
-            file_hash
+            stored_data,  # SQLite BLOB
+            file_size,
+            file_hash,
+            UPLOAD_COMPRESSION
         ))
         record_id = cursor.lastrowid
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"[Database] Saved upload for user '{username}': {filename} ({len(file_data)} bytes)")
+
     return record_id
 
 
@@ -465,28 +786,29 @@ def get_user_upload(username: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with file data and metadata, or None if not found
     """
-    conn = get_connection()
-    cursor = _get_cursor(conn)
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
     
-    if USE_POSTGRES:
-        cursor.execute("""
-            SELECT * FROM user_uploads 
-            WHERE username = %s
-        """, (username,))
-    else:
-        cursor.execute("""
-            SELECT * FROM user_uploads 
-            WHERE username = ?
-        """, (username,))
+        if USE_POSTGRES:
+            cursor.execute("""
+                SELECT * FROM user_uploads 
+                WHERE username = %s
+            """, (username,))
+        else:
+            cursor.execute("""
+                SELECT * FROM user_uploads 
+                WHERE username = ?
+            """, (username,))
     
-    row = cursor.fetchone()
-    conn.close()
+        row = cursor.fetchone()
     
     if row:
         record = _row_to_dict(row)
         # Ensure file_data is bytes (PostgreSQL BYTEA returns bytes, SQLite BLOB returns bytes)
         if record.get('file_data') and not isinstance(record['file_data'], bytes):
             record['file_data'] = bytes(record['file_data'])
+        if record.get('compression') == 'zlib':
+            record['file_data'] = zlib.decompress(record['file_data'])
         return record
     
     return None
@@ -502,26 +824,25 @@ def get_user_uploads(username: str) -> List[Dict[str, Any]]:
     Returns:
         List of upload records
     """
-    conn = get_connection()
-    cursor = _get_cursor(conn)
+    with get_connection() as conn:
+        cursor = _get_cursor(conn)
     
-    if USE_POSTGRES:
-        cursor.execute("""
-            SELECT id, username, filename, file_size_bytes, file_hash, upload_time
-            FROM user_uploads 
-            WHERE username = %s
-            ORDER BY upload_time DESC
-        """, (username,))
-    else:
-        cursor.execute("""
-            SELECT id, username, filename, file_size_bytes, file_hash, upload_time
-            FROM user_uploads 
-            WHERE username = ?
-            ORDER BY upload_time DESC
-        """, (username,))
+        if USE_POSTGRES:
+            cursor.execute("""
+                SELECT id, username, filename, file_size_bytes, file_hash, upload_time
+                FROM user_uploads 
+                WHERE username = %s
+                ORDER BY upload_time DESC
+            """, (username,))
+        else:
+            cursor.execute("""
+                SELECT id, username, filename, file_size_bytes, file_hash, upload_time
+                FROM user_uploads 
+                WHERE username = ?
+                ORDER BY upload_time DESC
+            """, (username,))
     
-    rows = cursor.fetchall()
-    conn.close()
+        rows = cursor.fetchall()
     
     return [_row_to_dict(row) for row in rows]
 
@@ -537,23 +858,22 @@ def delete_user_upload(username: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    with get_connection() as conn:
+        cursor = conn.cursor()
     
-    if USE_POSTGRES:
-        cursor.execute("""
-            DELETE FROM user_uploads 
-            WHERE username = %s
-        """, (username,))
-    else:
-        cursor.execute("""
-            DELETE FROM user_uploads 
-            WHERE username = ?
-        """, (username,))
+        if USE_POSTGRES:
+            cursor.execute("""
+                DELETE FROM user_uploads 
+                WHERE username = %s
+            """, (username,))
+        else:
+            cursor.execute("""
+                DELETE FROM user_uploads 
+                WHERE username = ?
+            """, (username,))
     
-    deleted = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
+        deleted = cursor.rowcount > 0
+        conn.commit()
     
     return deleted
 
@@ -40,9 +40,11 @@ class EEGAnalyzer:
         """
         results = {}
 
-        # 1. Signal Quality Metrics
-        results['snr_improvement'] = self._calculate_snr_improvement(raw_data, cleaned_data)
-        results['noise_reduction'] = self._calculate_noise_reduction(raw_data, cleaned_data)
+        # 1. Signal Quality Metrics (both derived from the same two signal powers)
+        raw_power = self._signal_power(raw_data)
+        cleaned_power = self._signal_power(cleaned_data)
+        results['snr_improvement'] = self._calculate_snr_improvement(raw_power, cleaned_power)
+        results['noise_reduction'] = self._calculate_noise_reduction(raw_power, cleaned_power)
 
         # 2. Frequency Band Analysis
         results['band_powers'] = self._analyze_frequency_bands(cleaned_data)
@@ -60,14 +62,12 @@ class EEGAnalyzer:
 
         return results
 
-    def _calculate_snr_improvement(self, raw, cleaned):
-        """Calculate signal-to-noise ratio improvement."""
-        raw_arr = np.asarray(raw).flatten()
-        cleaned_arr = np.asarray(cleaned).flatten()
+    def _signal_power(self, data):
+        """Signal power, using variance as a proxy."""
+        return np.var(np.asarray(data).ravel())
 
-        # Use variance as a proxy for signal power
-        raw_power = np.var(raw_arr)
-        cleaned_power = np.var(cleaned_arr)
+    def _calculate_snr_improvement(self, raw_power, cleaned_power):
+        """Calculate signal-to-noise ratio improvement from raw and cleaned signal powers."""
         noise_removed = raw_power - cleaned_power
 
         if raw_power > 0:
@@ -75,14 +75,8 @@ class EEGAnalyzer:
             return max(0, min(snr_db, 20))  # Cap between 0-20 dB for realistic values
         return 0
 
-    def _calculate_noise_reduction(self, raw, cleaned):
-        """Calculate percentage of noise reduction."""
-        raw_arr = np.asarray(raw).flatten()
-        cleaned_arr = np.asarray(cleaned).flatten()
-
-        raw_power = np.var(raw_arr)
-        cleaned_power = np.var(cleaned_arr)
-
+    def _calculate_noise_reduction(self, raw_power, cleaned_power):
+        """Calculate percentage of noise reduction from raw and cleaned signal powers."""
         if raw_power > 0:
             reduction = ((raw_power - cleaned_power) / raw_power) * 100
             return max(0, min(reduction, 100))
@@ -90,7 +84,7 @@ class EEGAnalyzer:
 
     def _analyze_frequency_bands(self, data):
         """Analyze power in different EEG frequency bands."""
-        data_arr = np.asarray(data).flatten()
+        data_arr = np.asarray(data).ravel()
 
         # Compute power spectral density
         freqs, psd = scipy_signal.welch(data_arr, fs=self.fs, nperseg=min(256, len(data_arr)))
@@ -118,7 +112,7 @@ class EEGAnalyzer:
 
     def _detect_remaining_artefacts(self, data):
         """Detect any remaining artefacts in cleaned data."""
-        data_arr = np.asarray(data).flatten()
+        data_arr = np.asarray(data).ravel()
 
         # Simple threshold-based detection
         threshold = 3 * np.std(data_arr)
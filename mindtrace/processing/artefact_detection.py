@@ -5,26 +5,18 @@ def detect_blink_artefacts(data, fs, threshold=120):
     Detects blink artefacts where amplitude exceeds threshold.
     Returns a list of (start_time, end_time) tuples in seconds.
     """
-    artefacts = []
     # Simple threshold detection
     mask = np.abs(data) > threshold
-    # Find continuous regions
-    # This is a simplified implementation
     indices = np.where(mask)[0]
     if len(indices) == 0:
         return []
     
-    # Group consecutive indices
-    from itertools import groupby
-    from operator import itemgetter
+    # Continuous regions break wherever consecutive indices jump by more than one
+    breaks = np.flatnonzero(np.diff(indices) != 1)
+    starts = indices[np.r_[0, breaks + 1]]
+    ends = indices[np.r_[breaks, len(indices) - 1]]
     
-    for k, g in groupby(enumerate(indices), lambda ix: ix[0] - ix[1]):
-        group = list(map(itemgetter(1), g))
-        start_idx = group[0]
-        end_idx = group[-1]
-        artefacts.append((start_idx / fs, end_idx / fs))
-        
-    return artefacts
+    return list(zip((starts / fs).tolist(), (ends / fs).tolist()))
 
 def detect_emg_artefacts(data, fs, freq_threshold=20):
     """
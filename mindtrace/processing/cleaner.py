@@ -1,5 +1,5 @@
 import numpy as np
-from .filters import bandpass_filter, notch_filter
+from .filters import bandpass_notch_filter
 from .artefact_detection import detect_blink_artefacts
 try:
     from sklearn.decomposition import FastICA
@@ -19,17 +19,21 @@ class EEGCleaner:
         """
         Applies standard cleaning pipeline.
         """
-        # 1. Bandpass
-        filtered = bandpass_filter(data, self.low, self.high, self.fs)
-        
-        # 2. Notch
-        filtered = notch_filter(filtered, self.notch, self.fs)
+        # 1-2. Bandpass + notch
+        filtered = self.prefilter(data)
         
         # 3. ICA-based artefact reduction (when available)
         cleaned = self.apply_ica(filtered)
         
         return cleaned
 
+    def prefilter(self, data):
+        """
+        Bandpass and notch filtering (the pipeline up to ICA), run as one
+        cascaded second-order-sections filter.
+        """
+        return bandpass_notch_filter(data, self.low, self.high, self.notch, self.fs)
+
     def apply_ica(self, data):
         """
         Runs a basic ICA decomposition and removes components
@@ -147,21 +151,7 @@ class EEGCleaner:
                 })
             
             # Calculate time range if provided
-            time_range_info = None
-            if start_time is not None and end_time is not None:
-                start_idx = int(start_time * self.fs)
-                end_idx = int(end_time * self.fs)
-                start_idx = max(0, min(start_idx, n_samples - 1))
-                end_idx = max(start_idx + 1, min(end_idx, n_samples))
-                
-                time_range_info = {
-                    'start_seconds': start_time,
-                    'end_seconds': end_time,
-                    'duration_seconds': end_time - start_time,
-                    'start_sample': start_idx,
-                    'end_sample': end_idx,
-                    'num_samples': end_idx - start_idx
-                }
+            time_range_info = self.ica_time_range(n_samples, start_time, end_time)
             
             return {
                 'n_components': n_components,
@@ -178,6 +168,28 @@ class EEGCleaner:
         except Exception as e:
             return {'error': f'ICA computation failed: {str(e)}'}
 
+    def ica_time_range(self, n_samples, start_time: float = None, end_time: float = None):
+        """
+        Time range block for compute_ica_details output. The decomposition itself
+        covers the whole record, so only this part depends on the requested range.
+        """
+        if start_time is None or end_time is None:
+            return None
+
+        start_idx = int(start_time * self.fs)
+        end_idx = int(end_time * self.fs)
+        start_idx = max(0, min(start_idx, n_samples - 1))
+        end_idx = max(start_idx + 1, min(end_idx, n_samples))
+
+        return {
+            'start_seconds': start_time,
+            'end_seconds': end_time,
+            'duration_seconds': end_time - start_time,
+            'start_sample': start_idx,
+            'end_sample': end_idx,
+            'num_samples': end_idx - start_idx
+        }
+
     def remove_artefacts(self, data, artefacts):
         """
         Zeroes out artefact regions.
@@ -53,8 +53,8 @@ class PipelineEvaluator:
         Returns:
             Dictionary containing all evaluation metrics
         """
-        raw_arr = np.asarray(raw_data).flatten()
-        cleaned_arr = np.asarray(cleaned_data).flatten()
+        raw_arr = np.asarray(raw_data).ravel()
+        cleaned_arr = np.asarray(cleaned_data).ravel()
 
         if len(raw_arr) != len(cleaned_arr):
             raise ValueError("Raw and cleaned data must have the same length")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import numpy as np
 import hashlib
@@ -23,7 +24,8 @@ class ActionTools:
         Saves dataset locally and optionally uploads to NeoFS.
         """
         print(f"[Spoon Tool] Saving dataset locally to {path}")
-        np.save(path, data)
+        # np.save blocks; keep it off the event loop
+        await asyncio.to_thread(np.save, path, data)
         
         if SPOON_TOOLS_AVAILABLE and self.config.get('neo', {}).get('container_id'):
             try:
@@ -1,37 +1,149 @@
 import asyncio
+import functools
 import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import aiofiles
 import markdown
 import numpy as np
+import orjson
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 
-from fastapi import FastAPI, File, UploadFile, Request, Form
-from fastapi.responses import HTMLResponse, FileResponse, RedirectResponse, Response
+from fastapi import BackgroundTasks, FastAPI, File, UploadFile, Request, Form
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from starlette.middleware.gzip import GZipMiddleware
 
 from .app import load_config
 from .agent.mindtrace_agent import MindTraceAgent
 from .data_loader import DataLoader
+from .processing.analyzer import EEGAnalyzer
+from .processing.cleaner import EEGCleaner
 from . import database as db
 
 
 BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
-app = FastAPI(title="MindTrace Web")
+# File downloads stay uncompressed: gzipping the ranged/ETagged responses from
+# _conditional_file_response would leave Content-Range offsets that don't match the
+# body and one strong ETag shared by two encodings.
+_UNCOMPRESSED_PATH_PREFIXES = ("/download/", "/audio/", "/report/html")
+
+
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the file download routes untouched."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(_UNCOMPRESSED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# JSON endpoints are serialised with orjson; HTML routes set HTMLResponse explicitly
+app = FastAPI(title="MindTrace Web", default_response_class=ORJSONResponse)
+# Pages, reports and waveform payloads are large, highly compressible text
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=1024)
+
+
+# Shared Markdown converter (extensions are loaded once) and a bounded LRU of
+# rendered reports keyed by a digest of the markdown source.
+_MARKDOWN = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'], output_format='html5')
+_MARKDOWN_LOCK = threading.Lock()
+_MD_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_MD_CACHE_MAXSIZE = 128
 
 
 def markdown_to_html(markdown_text: str) -> str:
     """Convert markdown text to formatted HTML."""
-    return markdown.markdown(
-        markdown_text,
-        extensions=['tables', 'fenced_code', 'nl2br']
-    )
+    key = hashlib.blake2b(markdown_text.encode('utf-8'), digest_size=16).hexdigest()
+
+    with _MARKDOWN_LOCK:
+        html = _MD_CACHE.get(key)
+        if html is not None:
+            _MD_CACHE.move_to_end(key)
+            return html
+
+        html = _MARKDOWN.reset().convert(markdown_text)
+        _MD_CACHE[key] = html
+        if len(_MD_CACHE) > _MD_CACHE_MAXSIZE:
+            _MD_CACHE.popitem(last=False)
+    return html
+
+# Rendered page bodies keyed by template name and a small caller-supplied key
+# (analysis id and the few scalars the page varies with), so reloading the same
+# analysis skips the Jinja render. Error pages aren't cached.
+_PAGE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_PAGE_CACHE_MAXSIZE = 32
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+def _render_page(request: Request, name: str, context: dict, cache_key: Optional[tuple] = None) -> HTMLResponse:
+    """
+    Render a template (which must not depend on the request). The body is cached under
+    cache_key, which must identify everything in context; None disables caching.
+    """
+    if cache_key is None or context.get("error"):
+        return templates.TemplateResponse(name, {"request": request, **context})
+
+    key = (name, cache_key)
+
+    with _PAGE_CACHE_LOCK:
+        body = _PAGE_CACHE.get(key)
+        if body is not None:
+            _PAGE_CACHE.move_to_end(key)
+            return HTMLResponse(body)
+
+    body = templates.get_template(name).render({"request": request, **context})
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE[key] = body
+        if len(_PAGE_CACHE) > _PAGE_CACHE_MAXSIZE:
+            _PAGE_CACHE.popitem(last=False)
+    return HTMLResponse(body)
+
+
+# Core MindTrace components are created once for the app lifetime, on first use
+# rather than at import, so importing the app (worker spin-up, reloads) stays cheap.
+_agent_instance: Optional[MindTraceAgent] = None
+_agent_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> dict:
+    """Load the MindTrace config once."""
+    return load_config()
+
+
+# The stored-upload reports only need the (stateless) cleaner and analyzer, so they
+# share one of each rather than building a whole MindTraceAgent per request.
+@functools.lru_cache(maxsize=None)
+def _report_cleaner() -> EEGCleaner:
+    return EEGCleaner(get_config()['eeg_processing'])
+
+
+@functools.lru_cache(maxsize=None)
+def _report_analyzer() -> EEGAnalyzer:
+    return EEGAnalyzer(get_config()['eeg_processing']['sampling_rate'])
+
+
+def get_agent() -> MindTraceAgent:
+    """Return the shared MindTraceAgent, creating it on first call."""
+    global _agent_instance
+    if _agent_instance is None:
+        with _agent_lock:
+            if _agent_instance is None:
+                _agent_instance = MindTraceAgent(get_config())
+    return _agent_instance
+
 
-# Initialise core MindTrace components once for the app lifetime.
-config = load_config()
-agent = MindTraceAgent(config)
 loader = DataLoader()
 
 UPLOAD_DIR = BASE_DIR / "uploads"
@@ -45,65 +157,426 @@ CLEANED_PATH = BASE_DIR.parent / "cleaned_data.npy"
 AUDIO_PATH = BASE_DIR.parent / "summary.mp3"
 REPORT_PATH = BASE_DIR.parent / "eeg_analysis_report.pdf"
 EVALUATION_REPORT_PATH = BASE_DIR.parent / "evaluation_report.md"
+REPORT_HTML_PATH = BASE_DIR.parent / "eeg_report.html"
+
+# Result of the last AUDIO_PATH.exists() check and when it was made; page renders
+# reuse it for a couple of seconds instead of stat()ing the file every time.
+_AUDIO_EXISTS_TTL = 2.0
+_audio_exists_state = (0.0, False)
+
+# Bumped whenever the agent's data changes; part of the chart/waveform cache keys
+_view_generation = 0
+
+# Fingerprint of the inputs the on-disk PDF/evaluation/HTML reports were last rendered from
+_last_report_signature: Optional[str] = None
+# Digest of the text last written to each report file, so unchanged reports aren't rewritten.
+# Written from worker threads and background tasks; the lock covers check, write and record.
+_written_report_digests: dict = {}
+_written_report_lock = threading.Lock()
+# Stored analysis the download files (cleaned data, PDF, audio summary) were last
+# written for; None once a command has modified the data or if unknown
+_download_files_analysis_id: Optional[int] = None
+
+# Static chart metadata for the frequency band visualisation
+_BAND_KEYS = ("delta", "theta", "alpha", "beta", "gamma")
+_BAND_LABELS = ("Delta (δ)", "Theta (θ)", "Alpha (α)", "Beta (β)", "Gamma (γ)")
+_BAND_COLORS = ("#FDCB6E", "#00B894", "#6C5CE7", "#0984E3", "#FD79A8")
+
+
+FILE_CHUNK_SIZE = 64 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# One bounded pool for all blocking pipeline work; asyncio.to_thread runs on the
+# loop's default executor, so installing it there covers every offloaded call.
+AGENT_WORKERS = min(8, os.cpu_count() or 2)
+_agent_executor: Optional[ThreadPoolExecutor] = None
+
+
+@app.on_event("startup")
+async def _install_agent_executor():
+    global _agent_executor
+    _agent_executor = ThreadPoolExecutor(max_workers=AGENT_WORKERS, thread_name_prefix="mindtrace-agent")
+    asyncio.get_running_loop().set_default_executor(_agent_executor)
+
+
+@app.on_event("shutdown")
+async def _shutdown_agent_executor():
+    if _agent_executor is not None:
+        _agent_executor.shutdown(wait=False)
+    db.close_connections()
+
+
+def _parse_range_header(range_header: str, size: int):
+    """
+    Parse a single-range "bytes=start-end" header.
+    Returns (start, end) inclusive, or None if the header is unusable.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+
+    start_str, _, end_str = range_header[len("bytes="):].strip().partition("-")
+    try:
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else size - 1
+        else:
+            # Suffix range: last N bytes
+            start = max(0, size - int(end_str))
+            end = size - 1
+    except ValueError:
+        return None
+
+    end = min(end, size - 1)
+    if start > end:
+        return None
+    return start, end
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header matches etag: "*", or a comma-separated list
+    of tags compared weakly (a W/ prefix is ignored).
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: Optional[str], mtime: float) -> bool:
+    """True if an If-Modified-Since date is at or after mtime (to the second)."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        # HTTP dates are always GMT
+        since = since.replace(tzinfo=timezone.utc)
+    return int(mtime) <= since.timestamp()
+
+
+def _if_range_matches(if_range: Optional[str], etag: str, last_modified: str) -> bool:
+    """
+    True if a range request may be served as a partial response: there is no
+    If-Range header, or it names the current ETag (strong comparison) or the
+    exact Last-Modified date.
+    """
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith("W/"):
+        return False
+    return if_range == etag or if_range == last_modified
+
+
+def _iter_file_range(path: Path, start: int, end: int):
+    """Yield the bytes of path between start and end (inclusive) in chunks."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _conditional_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    filename: str,
+    content_disposition_type: str = "attachment"
+) -> Response:
+    """
+    Serve a file with ETag/Last-Modified validators, answering 304 when the
+    client's cached copy is still current and 206 for byte-range requests.
+    """
+    st = os.stat(path)
+    etag = f'"{st.st_mtime_ns}-{st.st_size}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": "private, max-age=0, must-revalidate",
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif _not_modified_since(request.headers.get("if-modified-since"), st.st_mtime):
+        # If-Modified-Since is only consulted when there is no If-None-Match
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if _if_range_matches(request.headers.get("if-range"), etag, headers["Last-Modified"]):
+        # A stale If-Range falls through to the full 200 response below
+        byte_range = _parse_range_header(request.headers.get("range"), st.st_size)
+    if byte_range is not None:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+        headers["Content-Length"] = str(end - start + 1)
+        headers["Content-Disposition"] = f'{content_disposition_type}; filename="{filename}"'
+        return StreamingResponse(
+            _iter_file_range(path, start, end),
+            status_code=206,
+            media_type=media_type,
+            headers=headers,
+        )
+
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=st,
+        content_disposition_type=content_disposition_type,
+    )
+
+
+def _build_evaluation_summary(eval_results: Optional[dict]) -> Optional[dict]:
+    """Summarise live evaluator output for the results template."""
+    if not eval_results:
+        return None
+    sq = eval_results.get('signal_quality_metrics', {})
+    return {
+        "overall_score": eval_results.get('overall_score', 0),
+        "snr_db": sq.get('snr_db', 0),
+        "noise_reduction": sq.get('noise_reduction_percent', 0),
+        "signal_preservation": sq.get('signal_preservation_score', 0),
+        "health_status": eval_results.get('pipeline_health', {}).get('status', 'unknown')
+    }
+
+
+def _build_evaluation_summary_from_row(analysis: dict) -> Optional[dict]:
+    """Summarise the evaluation scores stored on an analysis row."""
+    overall_score = analysis.get('overall_score')
+    if not overall_score:
+        return None
+    return {
+        "overall_score": overall_score,
+        "snr_db": analysis.get('snr_improvement', 0),
+        "noise_reduction": analysis.get('noise_reduction_percent', 0),
+        "signal_preservation": analysis.get('signal_preservation', 0),
+        "health_status": "healthy"
+    }
+
+
+def _build_result_from_row(
+    analysis: dict,
+    analysis_id: int,
+    summary_prefix: str,
+    fallback_html: str,
+    audio_exists: bool
+) -> dict:
+    """Build the results template context for an analysis loaded from the database."""
+    full_results = analysis.get('full_results') or {}
+
+    # Generate report HTML from full_results
+    report_md = full_results.get('report', '')
+    html_report = markdown_to_html(report_md) if report_md else fallback_html
+
+    return {
+        "analysis_id": analysis_id,
+        "short_summary": full_results.get('short_summary', f"{summary_prefix}: {analysis.get('name') or analysis.get('filename')}"),
+        "full_report_html": html_report,
+        "audio_script": full_results.get('audio_script', ''),
+        "validation": {"valid": True},
+        "last_instruction": None,
+        "last_action_json": None,
+        "has_audio": audio_exists,
+        "evaluation": _build_evaluation_summary_from_row(analysis),
+    }
+
+
+def _audio_exists() -> bool:
+    """AUDIO_PATH.exists(), cached for _AUDIO_EXISTS_TTL seconds."""
+    global _audio_exists_state
+    checked_at, exists = _audio_exists_state
+    now = time.monotonic()
+    if now - checked_at > _AUDIO_EXISTS_TTL:
+        exists = AUDIO_PATH.exists()
+        _audio_exists_state = (now, exists)
+    return exists
+
+
+def _invalidate_audio_exists():
+    """Force the next _audio_exists() call to check the file again."""
+    global _audio_exists_state
+    _audio_exists_state = (0.0, False)
+
+
+def _invalidate_view_caches():
+    """
+    Drop cached chart/waveform payloads once the agent's new data (and analysis id)
+    have been published. The payloads are also keyed by generation, so one computed
+    from the old state by a request still in flight is never served afterwards.
+    """
+    global _view_generation
+    _view_generation += 1
+    _chart_data_for.cache_clear()
+    _waveform_for.cache_clear()
+
+
+def _report_signature(cleaned_data, analysis_results: dict) -> str:
+    """Fingerprint the cleaned signal and analysis results the reports are rendered from."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(cleaned_data))
+    h.update(orjson.dumps(
+        analysis_results,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ))
+    return h.hexdigest()
+
+
+async def _save_analysis_with_data(
+    raw_data_path: str,
+    cleaned_data_path: str,
+    **record
+) -> int:
+    """Save the agent's raw and cleaned arrays, then insert the analysis row pointing at them."""
+    agent = get_agent()
+    # EEG amplitudes carry far less than float64 precision, so persist as float32
+    raw_to_save = np.asarray(agent.raw_data).astype(np.float32, copy=False)
+    cleaned_to_save = np.asarray(agent.cleaned_data).astype(np.float32, copy=False)
+    await asyncio.gather(
+        asyncio.to_thread(np.save, raw_data_path, raw_to_save, allow_pickle=False),
+        asyncio.to_thread(np.save, cleaned_data_path, cleaned_to_save, allow_pickle=False),
+    )
+    return await asyncio.to_thread(
+        db.save_analysis,
+        raw_data_path=raw_data_path,
+        cleaned_data_path=cleaned_data_path,
+        **record
+    )
+
+
+async def _restore_analysis(analysis: dict, analysis_id: int):
+    """Load a saved analysis' arrays into the agent and make it the current analysis."""
+    agent = get_agent()
+    # Memory-map the saved arrays so only the pages actually used are read
+    agent.raw_data, agent.cleaned_data = await asyncio.gather(
+        asyncio.to_thread(np.load, analysis['raw_data_path'], mmap_mode='r', allow_pickle=False),
+        asyncio.to_thread(np.load, analysis['cleaned_data_path'], mmap_mode='r', allow_pickle=False),
+    )
+    agent.current_analysis_id = analysis_id
+    if (analysis.get('full_results') or {}).get('band_powers') is not None:
+        agent.set_last_analysis(analysis['full_results'])
+    _invalidate_view_caches()
+
+    # Scores come from the stored row; only evaluate now if they are missing,
+    # otherwise leave it to the evaluation endpoints.
+    agent.evaluation_results = None
+    if analysis.get('overall_score') is None:
+        await asyncio.to_thread(agent.run_evaluation)
+
+
+def _saved_data_exists(analysis: dict) -> bool:
+    """True if the analysis row points at raw/cleaned array files that are still on disk."""
+    raw_data_path = analysis.get('raw_data_path')
+    cleaned_data_path = analysis.get('cleaned_data_path')
+    return bool(raw_data_path and cleaned_data_path and Path(raw_data_path).exists() and Path(cleaned_data_path).exists())
+
+
+def _discard_previous_outputs():
+    """Remove the audio summary and evaluation report left behind by a different analysis."""
+    AUDIO_PATH.unlink(missing_ok=True)
+    EVALUATION_REPORT_PATH.unlink(missing_ok=True)
+
+
+def _write_evaluation_report(eval_results: dict):
+    """Render the evaluation report and write it to EVALUATION_REPORT_PATH if it changed."""
+    agent = get_agent()
+    _write_text_if_changed(EVALUATION_REPORT_PATH, agent.render_evaluation_report(eval_results))
+
+
+def _render_report_html(markdown_report: str) -> str:
+    """Render the markdown report to HTML and keep a copy on disk for /report/html."""
+    html_report = markdown_to_html(markdown_report)
+    _write_text_if_changed(REPORT_HTML_PATH, html_report)
+    return html_report
+
+
+def _write_text(path: Path, text: str):
+    """Write UTF-8 text to path (run via asyncio.to_thread from handlers)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_text_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the same content was already written there. Returns True if written."""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    with _written_report_lock:
+        if _written_report_digests.get(path) == digest and path.exists():
+            return False
+        _write_text(path, text)
+        _written_report_digests[path] = digest
+    return True
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request, analysis_id: Optional[int] = None, new: Optional[bool] = None):
+async def index(
+    request: Request,
+    analysis_id: Optional[int] = None,
+    new: Optional[bool] = None,
+    reeval: Optional[bool] = None
+):
     """
     Landing page with upload form, or displays a loaded analysis if analysis_id is provided.
     Use ?new=true to start a fresh session.
+    The evaluation shown for a saved analysis comes from the database; add
+    ?reeval=true to recompute it from the loaded data instead.
     """
+    agent = get_agent()
     result = None
     error = None
+    # Page cache key: what the result was built from (rows only change on rename),
+    # or None when the page can't be reused
+    page_key = ("form",)
 
     # If new=true, show the upload form regardless of loaded data
     if new:
-        return templates.TemplateResponse(
-            "index.html",
-            {"request": request, "result": None, "error": None},
-        )
+        return _render_page(request, "index.html", {"result": None, "error": None}, page_key)
 
     # Check if we should load a specific analysis
     if analysis_id:
-        analysis = db.get_analysis_by_id(analysis_id)
+        analysis = await asyncio.to_thread(db.get_analysis_by_id, analysis_id)
         if analysis:
-            raw_data_path = analysis.get('raw_data_path')
-            cleaned_data_path = analysis.get('cleaned_data_path')
+            already_loaded = (
+                getattr(agent, 'current_analysis_id', None) == analysis_id
+                and agent.raw_data is not None
+                and agent.cleaned_data is not None
+            )
 
-            if raw_data_path and cleaned_data_path and Path(raw_data_path).exists() and Path(cleaned_data_path).exists():
-                # Load the data into the agent
-                agent.raw_data = np.load(raw_data_path)
-                agent.cleaned_data = np.load(cleaned_data_path)
-                agent.current_analysis_id = analysis_id
-                agent.run_evaluation()
+            if already_loaded or _saved_data_exists(analysis):
+                if not already_loaded:
+                    # Load the data into the agent
+                    await _restore_analysis(analysis, analysis_id)
 
                 # Build result object from saved analysis
-                full_results = analysis.get('full_results', {})
-                evaluation_summary = None
-                if analysis.get('overall_score'):
-                    evaluation_summary = {
-                        "overall_score": analysis.get('overall_score'),
-                        "snr_db": analysis.get('snr_improvement', 0),
-                        "noise_reduction": analysis.get('noise_reduction_percent', 0),
-                        "signal_preservation": analysis.get('signal_preservation', 0),
-                        "health_status": "healthy"
-                    }
-
-                # Generate report HTML from full_results
-                report_md = full_results.get('report', '') if full_results else ''
-                html_report = markdown_to_html(report_md) if report_md else '<p>Analysis loaded from database.</p>'
-
-                result = {
-                    "analysis_id": analysis_id,
-                    "short_summary": full_results.get('short_summary', f"Loaded analysis: {analysis.get('name') or analysis.get('filename')}"),
-                    "full_report_html": html_report,
-                    "audio_script": full_results.get('audio_script', ''),
-                    "validation": {"valid": True},
-                    "last_instruction": None,
-                    "last_action_json": None,
-                    "has_audio": Path(AUDIO_PATH).exists(),
-                    "evaluation": evaluation_summary,
-                }
+                result = _build_result_from_row(
+                    analysis,
+                    analysis_id,
+                    summary_prefix="Loaded analysis",
+                    fallback_html='<p>Analysis loaded from database.</p>',
+                    audio_exists=_audio_exists()
+                )
+                page_key = ("loaded", analysis_id, analysis.get('name'), result["has_audio"])
+                if reeval:
+                    page_key = None
+                    eval_results = await asyncio.to_thread(agent.run_evaluation)
+                    if eval_results:
+                        result["evaluation"] = _build_evaluation_summary(eval_results)
             else:
                 error = "Analysis data files not found. This analysis may have been created before data persistence was enabled."
         else:
@@ -113,50 +586,29 @@ async def index(request: Request, analysis_id: Optional[int] = None, new: Option
     elif agent.raw_data is not None and agent.cleaned_data is not None:
         current_id = getattr(agent, 'current_analysis_id', None)
         if current_id:
-            analysis = db.get_analysis_by_id(current_id)
+            analysis = await asyncio.to_thread(db.get_analysis_by_id, current_id)
             if analysis:
-                full_results = analysis.get('full_results', {})
-                evaluation_summary = None
-                if analysis.get('overall_score'):
-                    evaluation_summary = {
-                        "overall_score": analysis.get('overall_score'),
-                        "snr_db": analysis.get('snr_improvement', 0),
-                        "noise_reduction": analysis.get('noise_reduction_percent', 0),
-                        "signal_preservation": analysis.get('signal_preservation', 0),
-                        "health_status": "healthy"
-                    }
-
-                report_md = full_results.get('report', '') if full_results else ''
-                html_report = markdown_to_html(report_md) if report_md else '<p>Analysis loaded.</p>'
-
-                result = {
-                    "analysis_id": current_id,
-                    "short_summary": full_results.get('short_summary', f"Current analysis: {analysis.get('name') or analysis.get('filename')}"),
-                    "full_report_html": html_report,
-                    "audio_script": full_results.get('audio_script', ''),
-                    "validation": {"valid": True},
-                    "last_instruction": None,
-                    "last_action_json": None,
-                    "has_audio": Path(AUDIO_PATH).exists(),
-                    "evaluation": evaluation_summary,
-                }
+                result = _build_result_from_row(
+                    analysis,
+                    current_id,
+                    summary_prefix="Current analysis",
+                    fallback_html='<p>Analysis loaded.</p>',
+                    audio_exists=_audio_exists()
+                )
+                page_key = ("current", current_id, analysis.get('name'), result["has_audio"])
 
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "result": result,
-            "error": error,
-        },
-    )
+    return _render_page(request, "index.html", {"result": result, "error": error}, page_key)
 
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """
     Dashboard showing analysis history from database.
     """
-    analyses = db.get_all_analyses(limit=50)
-    stats = db.get_statistics()
+    # The table only needs the summary columns, not the stored reports
+    analyses, stats = await asyncio.gather(
+        asyncio.to_thread(db.get_analysis_summaries, limit=50),
+        asyncio.to_thread(db.get_statistics),
+    )
     return templates.TemplateResponse(
         "dashboard.html",
         {
@@ -185,11 +637,19 @@ async def upload_get():
 
 
 @app.post("/upload", response_class=HTMLResponse)
-async def upload_dataset(request: Request, file: UploadFile = File(...), username: str = Form(None)):
+async def upload_dataset(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    username: str = Form(None)
+):
     """
     Accepts an EEG dataset upload, stores it in the database with username,
     runs the MindTrace cleaning pipeline, and returns a page with results.
     """
+    global _last_report_signature, _download_files_analysis_id
+    agent = get_agent()
+
     if not file.filename:
         return templates.TemplateResponse(
             "index.html",
@@ -214,22 +674,75 @@ async def upload_dataset(request: Request, file: UploadFile = File(...), usernam
     username = username.strip()
 
     file_path = UPLOAD_DIR / file.filename
-    contents = await file.read()
-    
-    # Save file to database with username
-    file_hash = hashlib.md5(contents).hexdigest()
-    db.save_user_upload(
+
+    # Stream the upload to disk in chunks, hashing as we go, so memory stays bounded
+    hasher = hashlib.sha256()
+    file_size = 0
+    async with aiofiles.open(file_path, 'wb') as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            file_size += len(chunk)
+            await out.write(chunk)
+    file_hash = hasher.hexdigest()
+
+    # Store the upload first, so it is kept even if the pipeline fails
+    await asyncio.to_thread(
+        db.save_user_upload,
         username=username,
         filename=file.filename,
-        file_data=contents,
+        file_path=str(file_path),
         file_hash=file_hash
     )
-    
-    # Also save to disk for processing (temporary)
-    file_path.write_bytes(contents)
+
+    # The same file has been processed before: restore that analysis instead of
+    # re-running cleaning, explanation and evaluation.
+    cached = await asyncio.to_thread(db.get_analysis_by_hash, file_hash)
+    if cached and cached.get('full_results') and _saved_data_exists(cached):
+        analysis_id = cached['id']
+        await _restore_analysis(cached, analysis_id)
+        full_results = cached['full_results']
+
+        # Validation is stored with the analysis (rows saved before it was aren't)
+        validation = full_results.get('validation')
+        reuse_steps = [asyncio.to_thread(agent.validate_data)] if validation is None else []
+        # Unless the download files are already this analysis', rewrite the cleaned
+        # data and PDF from it and drop the previous audio summary and evaluation report
+        if _download_files_analysis_id != analysis_id or not (CLEANED_PATH.exists() and REPORT_PATH.exists()):
+            reuse_steps.extend([
+                agent.save_results(path=str(CLEANED_PATH)),
+                asyncio.to_thread(agent.report_generator.generate_pdf_report, full_results, str(REPORT_PATH)),
+                asyncio.to_thread(_discard_previous_outputs),
+            ])
+        reuse_results = await asyncio.gather(*reuse_steps)
+        if validation is None:
+            validation = reuse_results[0]
+        _download_files_analysis_id = analysis_id
+        _invalidate_audio_exists()
+        # The markdown backup isn't needed for the response; write it afterwards
+        background_tasks.add_task(_write_text_if_changed, BASE_DIR.parent / "eeg_report.md", full_results.get('report', ''))
+        _last_report_signature = None
+
+        result = _build_result_from_row(
+            cached,
+            analysis_id,
+            summary_prefix="Loaded analysis",
+            fallback_html='<p>Analysis loaded from database.</p>',
+            audio_exists=_audio_exists()
+        )
+        result["validation"] = validation
+        await asyncio.to_thread(_write_text_if_changed, REPORT_HTML_PATH, result["full_report_html"])
+
+        return templates.TemplateResponse(
+            "index.html",
+            {
+                "request": request,
+                "result": result,
+                "error": None,
+            },
+        )
 
     try:
-        data = loader.load_file(str(file_path))
+        data = await asyncio.to_thread(loader.load_file, str(file_path))
     except Exception as exc:
         return templates.TemplateResponse(
             "index.html",
@@ -241,100 +754,89 @@ async def upload_dataset(request: Request, file: UploadFile = File(...), usernam
         )
 
     agent.load_data(data)
-    validation = agent.validate_data()
-    agent.initial_clean()
-
-    explanation, audio_path = agent.generate_explanation()
-    await agent.save_results(path=str(CLEANED_PATH))
-
-    # Run evaluation
-    agent.run_evaluation()
+    validation = await asyncio.to_thread(agent.validate_data)
+    await asyncio.to_thread(agent.initial_clean)
+
+    # Explanation (LLM/TTS), dataset save and evaluation only depend on the
+    # cleaned data; overlap them, then snapshot the evaluation results
+    (explanation, audio_path), _, _ = await asyncio.gather(
+        asyncio.to_thread(agent.generate_explanation),
+        agent.save_results(path=str(CLEANED_PATH)),
+        asyncio.to_thread(agent.run_evaluation),
+    )
+    _invalidate_audio_exists()
+    eval_results = agent.evaluation_results
 
     # Get analysis results and include display data for later retrieval
     analysis_results = explanation.get("analysis_results", {})
-    # Add display-relevant fields to full_results for database storage
-    analysis_results['report'] = explanation.get("full_report", "")
-    analysis_results['short_summary'] = explanation.get("short_summary", "")
-    analysis_results['audio_script'] = explanation.get("audio_script", "")
-
-    # Calculate file hash and get data info
-    file_hash = hashlib.md5(contents).hexdigest()
-    data_shape = np.asarray(data).shape
+    report_sig = await asyncio.to_thread(_report_signature, agent.cleaned_data, analysis_results)
+    # Add display-relevant fields to full_results for database storage. This is a
+    # copy: analysis_results is the agent's cached analysis and must stay untouched.
+    full_results = {
+        **analysis_results,
+        'report': explanation.get("full_report", ""),
+        'short_summary': explanation.get("short_summary", ""),
+        'audio_script': explanation.get("audio_script", ""),
+        'validation': validation,
+    }
+
+    # Get data info (the loader always returns an ndarray, so no conversion is needed)
+    data_shape = agent.raw_data.shape
     num_samples = data_shape[0] if len(data_shape) > 0 else 0
     num_channels = data_shape[1] if len(data_shape) > 1 else 1
-    fs = config['eeg_processing']['sampling_rate']
-    duration = num_samples / fs
+    duration = num_samples / agent.fs
 
-    # Save to database first to get the analysis ID
-    analysis_id = db.save_analysis(
-        filename=file.filename,
-        file_hash=file_hash,
-        file_size_bytes=len(contents),
-        num_channels=num_channels,
-        num_samples=num_samples,
-        duration_seconds=duration,
-        snr_improvement=analysis_results.get('snr_improvement'),
-        noise_reduction_percent=analysis_results.get('noise_reduction'),
-        dominant_band=analysis_results.get('dominant_band'),
-        artefacts_detected=analysis_results.get('artefacts_detected'),
-        band_powers=analysis_results.get('band_powers'),
-        overall_score=agent.evaluation_results.get('overall_score') if agent.evaluation_results else None,
-        signal_preservation=agent.evaluation_results.get('signal_quality_metrics', {}).get('signal_preservation_score') if agent.evaluation_results else None,
-        full_results=analysis_results
-    )
+    # Save raw and cleaned data files for later retrieval. Names are generated up
+    # front so the paths can go into the same INSERT as the rest of the record.
+    data_token = uuid.uuid4().hex
+    raw_data_path = str(ANALYSIS_DATA_DIR / f"raw_{data_token}.npy")
+    cleaned_data_path = str(ANALYSIS_DATA_DIR / f"cleaned_{data_token}.npy")
 
-    # Save raw and cleaned data files for later retrieval
-    raw_data_path = str(ANALYSIS_DATA_DIR / f"raw_{analysis_id}.npy")
-    cleaned_data_path = str(ANALYSIS_DATA_DIR / f"cleaned_{analysis_id}.npy")
-    np.save(raw_data_path, agent.raw_data)
-    np.save(cleaned_data_path, agent.cleaned_data)
-
-    # Update the database with data paths
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    if db.USE_POSTGRES:
-        cursor.execute("UPDATE analyses SET raw_data_path = %s, cleaned_data_path = %s WHERE id = %s",
-                      (raw_data_path, cleaned_data_path, analysis_id))
-    else:
-        cursor.execute("UPDATE analyses SET raw_data_path = ?, cleaned_data_path = ? WHERE id = ?",
-                      (raw_data_path, cleaned_data_path, analysis_id))
-    conn.commit()
-    conn.close()
+    # Save the markdown report as backup/display content
+    markdown_report = explanation.get("full_report", "")
 
-    # Store the current analysis ID for frontend
-    agent.current_analysis_id = analysis_id
+    # Persisting the analysis, the PDF, and the report files are independent; overlap them
+    persist_steps = [
+        _save_analysis_with_data(
+            raw_data_path,
+            cleaned_data_path,
+            filename=file.filename,
+            file_hash=file_hash,
+            file_size_bytes=file_size,
+            num_channels=num_channels,
+            num_samples=num_samples,
+            duration_seconds=duration,
+            snr_improvement=analysis_results.get('snr_improvement'),
+            noise_reduction_percent=analysis_results.get('noise_reduction'),
+            dominant_band=analysis_results.get('dominant_band'),
+            artefacts_detected=analysis_results.get('artefacts_detected'),
+            band_powers=analysis_results.get('band_powers'),
+            overall_score=eval_results.get('overall_score') if eval_results else None,
+            signal_preservation=eval_results.get('signal_quality_metrics', {}).get('signal_preservation_score') if eval_results else None,
+            full_results=full_results
+        ),
+        # Convert markdown to HTML for display
+        asyncio.to_thread(_render_report_html, markdown_report),
+        # Generate PDF Report
+        asyncio.to_thread(agent.report_generator.generate_pdf_report, full_results, str(REPORT_PATH)),
+    ]
+    analysis_id, html_report, _ = await asyncio.gather(*persist_steps)
 
-    # Generate PDF Report
-    agent.report_generator.generate_pdf_report(analysis_results, str(REPORT_PATH))
+    # The markdown backup and evaluation report aren't needed for the response;
+    # write them once it has been sent
+    background_tasks.add_task(_write_text_if_changed, BASE_DIR.parent / "eeg_report.md", markdown_report)
+    if eval_results:
+        background_tasks.add_task(_write_evaluation_report, eval_results)
 
-    # Save the markdown report as backup/display content
-    markdown_report = explanation.get("full_report", "")
-    
-    # Save markdown backup
-    with open(BASE_DIR.parent / "eeg_report.md", 'w', encoding='utf-8') as f:
-        f.write(markdown_report)
-
-    # Save evaluation report if available
-    if agent.evaluation_results:
-        eval_report = agent.get_evaluation_report()
-        with open(EVALUATION_REPORT_PATH, 'w', encoding='utf-8') as f:
-            f.write(eval_report)
-    # Convert markdown to HTML for display
-    html_report = markdown_to_html(markdown_report)
+    # Store the current analysis ID for frontend; cached chart/waveform payloads are
+    # only dropped now that the new data and its id are both in place
+    agent.current_analysis_id = analysis_id
+    _invalidate_view_caches()
+    _last_report_signature = report_sig
+    _download_files_analysis_id = analysis_id
 
     # Get evaluation results if available
-    evaluation_summary = None
-    if agent.evaluation_results:
-        eval_results = agent.evaluation_results
-        overall_score = eval_results.get('overall_score', 0)
-        sq = eval_results.get('signal_quality_metrics', {})
-        evaluation_summary = {
-            "overall_score": overall_score,
-            "snr_db": sq.get('snr_db', 0),
-            "noise_reduction": sq.get('noise_reduction_percent', 0),
-            "signal_preservation": sq.get('signal_preservation_score', 0),
-            "health_status": eval_results.get('pipeline_health', {}).get('status', 'unknown')
-        }
+    evaluation_summary = _build_evaluation_summary(eval_results)
 
     result = {
         "analysis_id": analysis_id,
@@ -368,13 +870,15 @@ async def command_get():
 
 
 @app.post("/command", response_class=HTMLResponse)
-async def run_command(request: Request, instruction: str = Form(...)):
+async def run_command(request: Request, background_tasks: BackgroundTasks, instruction: str = Form(...)):
     """
     Allows researchers to issue natural-language commands
     (e.g. 'find blink artefacts above 120uV')
     that are interpreted by SpoonOS and routed
     through the MindTraceAgent.
     """
+    global _last_report_signature, _download_files_analysis_id
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return templates.TemplateResponse(
             "index.html",
@@ -385,44 +889,70 @@ async def run_command(request: Request, instruction: str = Form(...)):
             },
         )
 
+    cleaned_before = agent.cleaned_data
     action_json = await agent.process_user_command(instruction)
-
-    explanation, audio_path = agent.generate_explanation()
-    await agent.save_results(path=str(CLEANED_PATH))
-
-    # Generate PDF Report
-    agent.report_generator.generate_pdf_report(explanation.get("analysis_results", {}), str(REPORT_PATH))
+    # The router hands back the same array for info-only actions and a new
+    # one when the data is modified, so identity tells us if anything changed.
+    data_changed = agent.cleaned_data is not cleaned_before
+    if data_changed:
+        _invalidate_view_caches()
+
+    # Explanation (LLM/TTS), dataset save and evaluation are independent; overlap them.
+    # Evaluation is only re-run if the command modified the data.
+    post_command_steps = [
+        asyncio.to_thread(agent.generate_explanation),
+        agent.save_results(path=str(CLEANED_PATH)),
+    ]
+    if data_changed or agent.evaluation_results is None:
+        post_command_steps.append(asyncio.to_thread(agent.run_evaluation))
+    (explanation, audio_path), *_ = await asyncio.gather(*post_command_steps)
+    _invalidate_audio_exists()
+    eval_results = agent.evaluation_results
+
+    # The cleaned data and audio summary were rewritten from the current (possibly modified) data
+    _download_files_analysis_id = None
+    # Skip re-rendering the report files if their inputs haven't changed and none is missing
+    markdown_backup_path = BASE_DIR.parent / "eeg_report.md"
+    analysis_results = explanation.get("analysis_results", {})
+    report_sig = await asyncio.to_thread(_report_signature, agent.cleaned_data, analysis_results)
+    reports_current = (
+        report_sig == _last_report_signature
+        and REPORT_PATH.exists()
+        and REPORT_HTML_PATH.exists()
+        and markdown_backup_path.exists()
+    )
 
     # Save the updated report content
     markdown_report = explanation.get("full_report", "")
 
-    # Save updated evaluation report
-    if agent.evaluation_results:
-        eval_report = agent.get_evaluation_report()
-        with open(EVALUATION_REPORT_PATH, 'w', encoding='utf-8') as f:
-            f.write(eval_report)
-
-    # Convert markdown to HTML for display
-    html_report = markdown_to_html(markdown_report)
-
-    validation = agent.validate_data()
-
-    # Re-run evaluation after command processing
-    agent.run_evaluation()
+    report_steps = [
+        asyncio.to_thread(agent.validate_data),
+        # Convert markdown to HTML for display (and refresh the on-disk copy if stale)
+        asyncio.to_thread(
+            markdown_to_html if reports_current else _render_report_html,
+            markdown_report
+        ),
+    ]
+    # Generate PDF Report
+    if not reports_current:
+        report_steps.append(asyncio.to_thread(
+            agent.report_generator.generate_pdf_report,
+            analysis_results,
+            str(REPORT_PATH)
+        ))
+    # Save the markdown backup and updated evaluation report after the response
+    # is sent (skipped when unchanged)
+    if not reports_current:
+        background_tasks.add_task(_write_text_if_changed, markdown_backup_path, markdown_report)
+    if eval_results and not (reports_current and EVALUATION_REPORT_PATH.exists()):
+        background_tasks.add_task(_write_evaluation_report, eval_results)
+
+    validation, html_report, *_ = await asyncio.gather(*report_steps)
+
+    _last_report_signature = report_sig
 
     # Get evaluation results if available
-    evaluation_summary = None
-    if agent.evaluation_results:
-        eval_results = agent.evaluation_results
-        overall_score = eval_results.get('overall_score', 0)
-        sq = eval_results.get('signal_quality_metrics', {})
-        evaluation_summary = {
-            "overall_score": overall_score,
-            "snr_db": sq.get('snr_db', 0),
-            "noise_reduction": sq.get('noise_reduction_percent', 0),
-            "signal_preservation": sq.get('signal_preservation_score', 0),
-            "health_status": eval_results.get('pipeline_health', {}).get('status', 'unknown')
-        }
+    evaluation_summary = _build_evaluation_summary(eval_results)
 
     result = {
         "short_summary": explanation.get("short_summary"),
@@ -446,14 +976,15 @@ async def run_command(request: Request, instruction: str = Form(...)):
 
 
 @app.get("/download/cleaned")
-async def download_cleaned():
+async def download_cleaned(request: Request):
     """
     Download the most recently cleaned dataset.
     """
     if not CLEANED_PATH.exists():
         return HTMLResponse("No cleaned dataset available yet.", status_code=404)
 
-    return FileResponse(
+    return _conditional_file_response(
+        request,
         CLEANED_PATH,
         media_type="application/octet-stream",
         filename="cleaned_data.npy",
@@ -461,14 +992,15 @@ async def download_cleaned():
 
 
 @app.get("/audio/summary")
-async def get_audio_summary():
+async def get_audio_summary(request: Request):
     """
     Serve the audio summary file (MP3).
     """
     if not AUDIO_PATH.exists():
         return HTMLResponse("No audio summary available yet.", status_code=404)
 
-    return FileResponse(
+    return _conditional_file_response(
+        request,
         AUDIO_PATH,
         media_type="audio/mpeg",
         filename="summary.mp3",
@@ -476,64 +1008,80 @@ async def get_audio_summary():
 
 
 @app.get("/download/report")
-async def download_report():
+async def download_report(request: Request):
     """
     Download the full scientific report as a PDF file.
     """
     if not REPORT_PATH.exists():
         return HTMLResponse("No report available yet.", status_code=404)
 
-    return FileResponse(
+    return _conditional_file_response(
+        request,
         REPORT_PATH,
         media_type="application/pdf",
         filename="eeg_analysis_report.pdf",
     )
 
 
+@app.get("/report/html")
+async def view_report_html(request: Request):
+    """
+    Serve the pre-rendered HTML version of the latest analysis report.
+    """
+    if not REPORT_HTML_PATH.exists():
+        return HTMLResponse("No report available yet.", status_code=404)
+
+    return _conditional_file_response(
+        request,
+        REPORT_HTML_PATH,
+        media_type="text/html",
+        filename="eeg_report.html",
+        content_disposition_type="inline",
+    )
+
+
 @app.get("/download/evaluation-report")
-async def download_evaluation_report():
+async def download_evaluation_report(request: Request):
     """
     Download the evaluation report as a Markdown file.
     """
+    agent = get_agent()
+    if agent.raw_data is None or agent.cleaned_data is None:
+        return HTMLResponse("No evaluation results available. Please process data first.", status_code=404)
+
+    # Run evaluation if not already done
+    if agent.evaluation_results is None:
+        await asyncio.to_thread(agent.run_evaluation)
+
     if agent.evaluation_results is None:
         return HTMLResponse("No evaluation results available. Please process data first.", status_code=404)
 
-    # Generate and save the evaluation report
-    report = agent.get_evaluation_report()
-    with open(EVALUATION_REPORT_PATH, 'w', encoding='utf-8') as f:
-        f.write(report)
+    # Rendering is cached per result set and the file is only rewritten when
+    # its contents change, so repeat downloads just stream the existing file
+    await asyncio.to_thread(_write_evaluation_report, agent.evaluation_results)
 
-    return FileResponse(
+    return _conditional_file_response(
+        request,
         EVALUATION_REPORT_PATH,
         media_type="text/markdown",
         filename="pipeline_evaluation_report.md",
     )
 
 
-@app.get("/api/chart-data")
-async def get_chart_data():
-    """
-    Get chart data for visualizations.
-    Returns frequency analysis and signal quality data.
-    """
-    if agent.raw_data is None or agent.cleaned_data is None:
-        return {"error": "No data available. Please upload a dataset first."}
-
-    # Get analysis results
-    analysis_results = agent.analyzer.analyze(agent.raw_data, agent.cleaned_data)
+@functools.lru_cache(maxsize=8)
+def _chart_data_for(analysis_id: Optional[int], generation: int) -> dict:
+    """Build the chart payload for the currently loaded data (cached per analysis and data generation)."""
+    agent = get_agent()
+    # Reuse the analysis already computed for the report when the data hasn't changed
+    analysis_results = agent.analyze_current()
 
     # Prepare chart data
-    chart_data = {
+    band_powers = analysis_results['band_powers']
+    return {
         "frequency_bands": {
-            "labels": ["Delta (δ)", "Theta (θ)", "Alpha (α)", "Beta (β)", "Gamma (γ)"],
-            "data": [
-                analysis_results['band_powers'].get('delta', 0),
-                analysis_results['band_powers'].get('theta', 0),
-                analysis_results['band_powers'].get('alpha', 0),
-                analysis_results['band_powers'].get('beta', 0),
-                analysis_results['band_powers'].get('gamma', 0)
-            ],
-            "colors": ["#FDCB6E", "#00B894", "#6C5CE7", "#0984E3", "#FD79A8"]
+            "labels": _BAND_LABELS,
+            "data": [band_powers.get(k, 0) for k in _BAND_KEYS],
+            "colors": _BAND_COLORS
         },
         "metrics": {
             "snr": analysis_results.get('snr_improvement', 0),
@@ -543,49 +1091,33 @@ async def get_chart_data():
         }
     }
 
-    return chart_data
-
 
-@app.get("/api/waveform-data")
-async def get_waveform_data(start: float = 0.0, window: float = 5.0, channel: int = 0):
+@app.get("/api/chart-data")
+async def get_chart_data():
     """
-    Get waveform data for visualization with proper time windowing.
-
-    Args:
-        start: Start time in seconds (default: 0)
-        window: Time window duration in seconds (default: 5s for clear visualization)
-        channel: Channel index to display (default: 0, use -1 for mean across channels)
-
-    Returns downsampled raw and cleaned signal data for the specified time window.
+    Get chart data for visualizations.
+    Returns frequency analysis and signal quality data.
     """
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return {"error": "No data available. Please upload a dataset first."}
 
-    # Convert to numpy arrays
-    raw_arr = np.asarray(agent.raw_data)
-    cleaned_arr = np.asarray(agent.cleaned_data)
+    return await asyncio.to_thread(_chart_data_for, getattr(agent, 'current_analysis_id', None), _view_generation)
+
+
+@functools.lru_cache(maxsize=64)
+def _waveform_for(analysis_id: Optional[int], generation: int, start: float, window: float, channel: int) -> dict:
+    """Build the downsampled waveform payload for one window (cached per analysis, data generation and window)."""
+    agent = get_agent()
+    # Keep memory-mapped arrays as they are; only the requested window gets read
+    raw_arr = agent.raw_data if isinstance(agent.raw_data, np.ndarray) else np.asarray(agent.raw_data)
+    cleaned_arr = agent.cleaned_data if isinstance(agent.cleaned_data, np.ndarray) else np.asarray(agent.cleaned_data)
 
-    # Handle multi-channel data properly
     # Data shape is typically [samples, channels] or [samples]
-    if raw_arr.ndim == 1:
-        raw_full = raw_arr
-        cleaned_full = cleaned_arr
-        num_channels = 1
-    else:
-        num_channels = raw_arr.shape[1] if raw_arr.ndim > 1 else 1
-        if channel == -1:
-            # Mean across all channels
-            raw_full = np.mean(raw_arr, axis=1)
-            cleaned_full = np.mean(cleaned_arr, axis=1)
-        else:
-            # Select specific channel (clamp to valid range)
-            ch = min(channel, num_channels - 1)
-            raw_full = raw_arr[:, ch]
-            cleaned_full = cleaned_arr[:, ch]
+    num_channels = raw_arr.shape[1] if raw_arr.ndim > 1 else 1
 
-    # Get sampling rate from config
-    fs = agent.config['eeg_processing']['sampling_rate']
-    total_duration = len(raw_full) / fs
+    fs = agent.fs
+    total_duration = raw_arr.shape[0] / fs
 
     # Clamp start time to valid range
     start = max(0, min(start, total_duration - 0.1))
@@ -598,31 +1130,44 @@ async def get_waveform_data(start: float = 0.0, window: float = 5.0, channel: in
     start_idx = int(start * fs)
     end_idx = int(end_time * fs)
 
-    # Extract the time window
-    raw_arr = raw_full[start_idx:end_idx]
-    cleaned_arr = cleaned_full[start_idx:end_idx]
+    # Slice the time window first, then reduce channels on just that window
+    raw_window = raw_arr[start_idx:end_idx]
+    cleaned_window = cleaned_arr[start_idx:end_idx]
+    if raw_arr.ndim == 1:
+        raw_arr = np.array(raw_window)
+        cleaned_arr = np.array(cleaned_window)
+    elif channel == -1:
+        # Mean across all channels
+        raw_arr = np.mean(raw_window, axis=1)
+        cleaned_arr = np.mean(cleaned_window, axis=1)
+    else:
+        # Select specific channel (clamp to valid range)
+        ch = min(channel, num_channels - 1)
+        raw_arr = np.array(raw_window[:, ch])
+        cleaned_arr = np.array(cleaned_window[:, ch])
 
     # For visualization, target ~500 points per second (good for seeing EEG waves)
     # but cap at 2000 total points for performance
-    target_points = min(int(actual_window * 500), 2000)
-
-    if len(raw_arr) > target_points:
-        # Use proper decimation: average over windows to preserve signal shape
-        step = len(raw_arr) // target_points
-        # Reshape and take mean to avoid aliasing
-        trim_len = (len(raw_arr) // step) * step
-        raw_reshaped = raw_arr[:trim_len].reshape(-1, step)
-        cleaned_reshaped = cleaned_arr[:trim_len].reshape(-1, step)
-        raw_arr = raw_reshaped.mean(axis=1)
-        cleaned_arr = cleaned_reshaped.mean(axis=1)
+    target_points = max(1, min(int(actual_window * 500), 2000))
+
+    n = len(raw_arr)
+    if n > target_points:
+        # Use proper decimation: average over bins to preserve signal shape and avoid aliasing.
+        # reduceat sums each bin in one pass; the last bin may be shorter than step.
+        step = n // target_points
+        edges = np.arange(0, n, step)
+        counts = np.diff(np.append(edges, n))
+        raw_arr = np.add.reduceat(raw_arr, edges) / counts
+        cleaned_arr = np.add.reduceat(cleaned_arr, edges) / counts
 
     # Create time axis for the window
-    time_axis = np.linspace(start, end_time, len(raw_arr)).tolist()
+    time_axis = np.linspace(start, end_time, len(raw_arr), dtype=np.float32)
 
+    # float32 is plenty for plotting
     return {
         "time": time_axis,
-        "raw": raw_arr.tolist(),
-        "cleaned": cleaned_arr.tolist(),
+        "raw": raw_arr.astype(np.float32, copy=False),
+        "cleaned": cleaned_arr.astype(np.float32, copy=False),
         "sampling_rate": fs,
         "total_duration": total_duration,
         "window_start": start,
@@ -635,18 +1180,49 @@ async def get_waveform_data(start: float = 0.0, window: float = 5.0, channel: in
     }
 
 
+@app.get("/api/waveform-data")
+async def get_waveform_data(start: float = 0.0, window: float = 5.0, channel: int = 0):
+    """
+    Get waveform data for visualization with proper time windowing.
+
+    Args:
+        start: Start time in seconds (default: 0)
+        window: Time window duration in seconds (default: 5s for clear visualization)
+        channel: Channel index to display (default: 0, use -1 for mean across channels)
+
+    Returns downsampled raw and cleaned signal data for the specified time window.
+    """
+    agent = get_agent()
+    if agent.raw_data is None or agent.cleaned_data is None:
+        return {"error": "No data available. Please upload a dataset first."}
+
+    # Bucket the window to 10 ms so small UI jitter still hits the cache
+    payload = await asyncio.to_thread(
+        _waveform_for,
+        getattr(agent, 'current_analysis_id', None),
+        _view_generation,
+        round(start, 2),
+        round(window, 2),
+        channel
+    )
+
+    # NumPy arrays are serialised directly by orjson
+    return ORJSONResponse(payload)
+
+
 @app.get("/api/evaluation")
 async def get_evaluation():
     """
     Get comprehensive evaluation results for the processing pipeline.
     Returns detailed metrics and scores.
     """
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return {"error": "No data available. Please upload a dataset first."}
 
     # Run evaluation if not already done
     if agent.evaluation_results is None:
-        agent.run_evaluation()
+        await asyncio.to_thread(agent.run_evaluation)
 
     if agent.evaluation_results is None:
         return {"error": "Failed to generate evaluation results."}
@@ -659,12 +1235,13 @@ async def get_evaluation_report():
     """
     Get a formatted evaluation report in Markdown format.
     """
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return HTMLResponse("No data available. Please upload a dataset first.", status_code=404)
 
     # Run evaluation if not already done
     if agent.evaluation_results is None:
-        agent.run_evaluation()
+        await asyncio.to_thread(agent.run_evaluation)
 
     report = agent.get_evaluation_report()
     return HTMLResponse(f"<pre>{report}</pre>", media_type="text/html")
@@ -675,10 +1252,11 @@ async def run_evaluation():
     """
     Manually trigger evaluation of the processing pipeline.
     """
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return {"error": "No data available. Please upload a dataset first."}
 
-    results = agent.run_evaluation()
+    results = await asyncio.to_thread(agent.run_evaluation)
     if results is None:
         return {"error": "Failed to run evaluation."}
 
@@ -694,7 +1272,7 @@ async def get_analyses(limit: int = 50):
     """
     Get all analysis records from the database.
     """
-    analyses = db.get_all_analyses(limit=limit)
+    analyses = await asyncio.to_thread(db.get_all_analyses, limit=limit)
     return {"analyses": analyses, "count": len(analyses)}
 
 
@@ -703,7 +1281,7 @@ async def get_analysis(analysis_id: int):
     """
     Get a specific analysis by ID.
     """
-    analysis = db.get_analysis_by_id(analysis_id)
+    analysis = await asyncio.to_thread(db.get_analysis_by_id, analysis_id)
     if analysis is None:
         return {"error": "Analysis not found"}
     return analysis
@@ -714,7 +1292,7 @@ async def get_statistics():
     """
     Get aggregate statistics from all analyses.
     """
-    stats = db.get_statistics()
+    stats = await asyncio.to_thread(db.get_statistics)
     return stats
 
 
@@ -723,7 +1301,7 @@ async def delete_analysis(analysis_id: int):
     """
     Delete an analysis record.
     """
-    deleted = db.delete_analysis(analysis_id)
+    deleted = await asyncio.to_thread(db.delete_analysis, analysis_id)
     if not deleted:
         return {"error": "Analysis not found"}
     return {"success": True, "message": f"Analysis {analysis_id} deleted"}
@@ -737,7 +1315,7 @@ async def rename_analysis_endpoint(analysis_id: int, name: str):
     if not name or name.strip() == "":
         return {"error": "Name cannot be empty"}
 
-    renamed = db.rename_analysis(analysis_id, name.strip())
+    renamed = await asyncio.to_thread(db.rename_analysis, analysis_id, name.strip())
     if not renamed:
         return {"error": "Analysis not found"}
     return {"success": True, "message": f"Analysis {analysis_id} renamed to '{name}'"}
@@ -749,7 +1327,7 @@ async def load_analysis(analysis_id: int):
     Load a saved analysis into the agent state.
     This restores the raw and cleaned data from saved files.
     """
-    analysis = db.get_analysis_by_id(analysis_id)
+    analysis = await asyncio.to_thread(db.get_analysis_by_id, analysis_id)
     if analysis is None:
         return {"error": "Analysis not found"}
 
@@ -764,12 +1342,7 @@ async def load_analysis(analysis_id: int):
         return {"error": "Analysis data files have been deleted or moved."}
 
     # Load the data into the agent
-    agent.raw_data = np.load(raw_data_path)
-    agent.cleaned_data = np.load(cleaned_data_path)
-    agent.current_analysis_id = analysis_id
-
-    # Re-run evaluation to restore evaluation_results
-    agent.run_evaluation()
+    await _restore_analysis(analysis, analysis_id)
 
     return {
         "success": True,
@@ -791,12 +1364,13 @@ async def get_current_analysis():
     """
     Get the current loaded analysis ID and basic info.
     """
+    agent = get_agent()
     if agent.raw_data is None or agent.cleaned_data is None:
         return {"loaded": False}
 
     analysis_id = getattr(agent, 'current_analysis_id', None)
     if analysis_id:
-        analysis = db.get_analysis_by_id(analysis_id)
+        analysis = await asyncio.to_thread(db.get_analysis_by_id, analysis_id)
         return {
             "loaded": True,
             "analysis_id": analysis_id,
@@ -826,6 +1400,7 @@ async def process_and_evaluate(username: str):
     Returns:
         Combined markdown-formatted report with both EEG analysis and evaluation sections
     """
+    agent = get_agent()
     if not username or username.strip() == "":
         return Response(
             content="Error: Username is required. Use ?username=your_username",
@@ -837,7 +1412,7 @@ async def process_and_evaluate(username: str):
     
     try:
         # Retrieve file from database (each username has exactly one file)
-        upload_record = db.get_user_upload(username)
+        upload_record = await asyncio.to_thread(db.get_user_upload, username)
         
         if upload_record is None:
             return Response(
@@ -850,69 +1425,65 @@ async def process_and_evaluate(username: str):
         file_data = upload_record['file_data']
         stored_filename = upload_record['filename']
         
-        # Save to temporary file for processing
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp:
-            tmp.write(file_data)
-            tmp_path = tmp.name
-        
+        # Parse the stored contents directly; no temporary file round-trip
         try:
-            # Load data
-            try:
-                data = loader.load_file(tmp_path)
-            except Exception as exc:
-                return Response(
-                    content=f"Error: Failed to load data file: {exc}",
-                    status_code=400,
-                    media_type="text/plain"
-                )
-            
-            # Process through full pipeline
-            agent.load_data(data)
-            validation = agent.validate_data()
-            
-            # Check validation
-            if not validation.get('valid', False):
-                issues = validation.get('issues', [])
-                return Response(
-                    content=f"Error: Data validation failed. Issues: {', '.join(issues)}",
-                    status_code=400,
-                    media_type="text/plain"
-                )
-            
-            # Run cleaning
-            agent.initial_clean()
-            
-            # Generate explanation (for analysis results and EEG report)
-            explanation, _ = agent.generate_explanation()
-            
-            # Get EEG report from explanation
-            eeg_report = explanation.get("full_report", "")
-            
-            # Run evaluation
-            evaluation_results = agent.run_evaluation()
-            
-            if evaluation_results is None:
-                return Response(
-                    content="Error: Failed to generate evaluation results.",
-                    status_code=500,
-                    media_type="text/plain"
-                )
-            
-            # Generate markdown evaluation report
-            evaluation_report = agent.get_evaluation_report()
-            
-            # Combine both reports into a single markdown document
-            combined_report = f"""# EEG Analysis Report
-
-Generated for: {username}
-Source File: {stored_filename}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
----
-
-## Part 1: EEG Signal Analysis Report
-
+            data = await asyncio.to_thread(
+                loader.load_bytes, file_data, os.path.splitext(stored_filename)[1]
+            )
+        except Exception as exc:
+            return Response(
+                content=f"Error: Failed to load data file: {exc}",
+                status_code=400,
+                media_type="text/plain"
+            )
+        
+        # Process through full pipeline (CPU-bound steps run off the event loop)
+        agent.load_data(data)
+        validation = await asyncio.to_thread(agent.validate_data)
+        
+        # Check validation
+        if not validation.get('valid', False):
+            issues = validation.get('issues', [])
+            return Response(
+                content=f"Error: Data validation failed. Issues: {', '.join(issues)}",
+                status_code=400,
+                media_type="text/plain"
+            )
+        
+        # Run cleaning
+        await asyncio.to_thread(agent.initial_clean)
+        _invalidate_view_caches()
+        
+        # Generate explanation (for analysis results and EEG report)
+        explanation, _ = await asyncio.to_thread(agent.generate_explanation)
+        
+        # Get EEG report from explanation
+        eeg_report = explanation.get("full_report", "")
+        
+        # Run evaluation
+        evaluation_results = await asyncio.to_thread(agent.run_evaluation)
+        
+        if evaluation_results is None:
+            return Response(
+                content="Error: Failed to generate evaluation results.",
+                status_code=500,
+                media_type="text/plain"
+            )
+        
+        # Generate markdown evaluation report
+        evaluation_report = await asyncio.to_thread(agent.get_evaluation_report)
+        
+        # Combine both reports into a single markdown document
+        combined_report = f"""# EEG Analysis Report
+
+Generated for: {username}
+Source File: {stored_filename}
+Generated: {_report_timestamp()}
+
+---
+
+## Part 1: EEG Signal Analysis Report
+
 {eeg_report}
 
 ---
@@ -921,23 +1492,15 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 {evaluation_report}
 """
-            
-            # Return combined markdown report
-            return Response(
-                content=combined_report,
-                media_type="text/markdown",
-                headers={
-                    "Content-Disposition": f"attachment; filename=complete_report_{stored_filename}.md"
-                }
-            )
         
-        finally:
-            # Clean up temporary file
-            try:
-                import os
-                os.unlink(tmp_path)
-            except:
-                pass
+        # Return combined markdown report
+        return Response(
+            content=combined_report,
+            media_type="text/markdown",
+            headers={
+                "Content-Disposition": f"attachment; filename=complete_report_{stored_filename}.md"
+            }
+        )
         
     except Exception as e:
         import traceback
@@ -986,7 +1549,7 @@ async def get_ica_report(username: str, start_time: float, end_time: float):
     
     try:
         # Retrieve file from database
-        upload_record = db.get_user_upload(username)
+        upload_record = await asyncio.to_thread(db.get_user_upload, username)
         
         if upload_record is None:
             return Response(
@@ -995,89 +1558,8 @@ async def get_ica_report(username: str, start_time: float, end_time: float):
                 media_type="text/plain"
             )
         
-        # Get file data from database
-        file_data = upload_record['file_data']
-        stored_filename = upload_record['filename']
-        
-        # Save to temporary file for processing
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp:
-            tmp.write(file_data)
-            tmp_path = tmp.name
-        
-        try:
-            # Load data
-            try:
-                data = loader.load_file(tmp_path)
-            except Exception as exc:
-                return Response(
-                    content=f"Error: Failed to load data file: {exc}",
-                    status_code=400,
-                    media_type="text/plain"
-                )
-            
-            # Perform analysis comparison using shared function
-            raw_analysis, cleaned_analysis, cleaned_data, fs, time_range_info = _perform_analysis_comparison(
-                data, start_time, end_time
-            )
-            
-            # Apply filters (bandpass and notch) to get data in the same state as before ICA
-            # This matches what the cleaner does before ICA
-            from mindtrace.processing.filters import bandpass_filter, notch_filter
-            request_agent = MindTraceAgent(config)
-            request_agent.load_data(data)
-            filtered = bandpass_filter(
-                data, 
-                request_agent.cleaner.low, 
-                request_agent.cleaner.high, 
-                request_agent.cleaner.fs
-            )
-            filtered = notch_filter(filtered, request_agent.cleaner.notch, request_agent.cleaner.fs)
-            
-            # Compute ICA details on-demand (only when this endpoint is called)
-            ica_details = request_agent.cleaner.compute_ica_details(filtered, start_time, end_time)
-            
-            if ica_details is None or 'error' in ica_details:
-                error_msg = ica_details.get('error', 'Unknown error') if ica_details else 'ICA computation returned None'
-                return Response(
-                    content=f"Error: ICA processing failed. {error_msg}",
-                    status_code=400,
-                    media_type="text/plain"
-                )
-            
-            # Generate analysis comparison section using shared function
-            analysis_comparison_section = _generate_analysis_comparison_section(
-                raw_analysis,
-                cleaned_analysis,
-                time_range_info
-            )
-            
-            # Generate markdown report with ICA details and analysis comparison
-            report = _generate_ica_markdown_report(
-                ica_details, 
-                username, 
-                stored_filename, 
-                start_time, 
-                end_time,
-                analysis_comparison_section
-            )
-            
-            # Return markdown report
-            return Response(
-                content=report,
-                media_type="text/markdown",
-                headers={
-                    "Content-Disposition": f"attachment; filename=ica_report_{username}_{start_time}s_to_{end_time}s.md"
-                }
-            )
-        
-        finally:
-            # Clean up temporary file
-            try:
-                import os
-                os.unlink(tmp_path)
-            except:
-                pass
+        # Parsing, cleaning and report generation are CPU-bound
+        return await asyncio.to_thread(_build_ica_report_response, upload_record, username, start_time, end_time)
         
     except Exception as e:
         import traceback
@@ -1089,7 +1571,199 @@ async def get_ica_report(username: str, start_time: float, end_time: float):
         )
 
 
-def _perform_analysis_comparison(data, start_time: float = None, end_time: float = None):
+def _build_ica_report_response(upload_record: dict, username: str, start_time: float, end_time: float) -> Response:
+    """Load a stored upload and build the ICA report response (blocking; run off the event loop)."""
+    # Get file data from the stored upload
+    file_data = upload_record['file_data']
+    stored_filename = upload_record['filename']
+    file_hash = upload_record.get('file_hash') or hashlib.sha256(file_data).hexdigest()
+    
+    # Uploads already in the pipeline cache aren't parsed (or cleaned) again
+    pipeline = _cached_pipeline(file_hash)
+    if pipeline is None:
+        # Parse the stored contents directly; no temporary file round-trip
+        try:
+            data = loader.load_bytes(file_data, os.path.splitext(stored_filename)[1])
+        except Exception as exc:
+            return Response(
+                content=f"Error: Failed to load data file: {exc}",
+                status_code=400,
+                media_type="text/plain"
+            )
+        pipeline = _pipeline_outputs(file_hash, data)
+    
+    # Analysis comparison section for this window (shared with the comparison report)
+    analysis_comparison_section, _ = _comparison_section(pipeline, start_time, end_time)
+    
+    cleaner = _report_cleaner()
+    
+    # Compute ICA details on-demand (only when this endpoint is called). The
+    # decomposition covers the whole record, so it is fitted once per upload and
+    # only the time range block is rebuilt for each requested window.
+    ica_details = pipeline.get('ica_details')
+    if ica_details is None:
+        # Bandpass + notch puts the data in the same state the cleaner runs ICA on
+        filtered = cleaner.prefilter(pipeline['data'])
+        ica_details = cleaner.compute_ica_details(filtered)
+        pipeline['ica_details'] = ica_details
+    
+    if ica_details is None or 'error' in ica_details:
+        error_msg = ica_details.get('error', 'Unknown error') if ica_details else 'ICA computation returned None'
+        return Response(
+            content=f"Error: ICA processing failed. {error_msg}",
+            status_code=400,
+            media_type="text/plain"
+        )
+    ica_details = {
+        **ica_details,
+        'time_range': cleaner.ica_time_range(ica_details['n_samples'], start_time, end_time)
+    }
+    
+    # Generate markdown report with ICA details and analysis comparison
+    report = _generate_ica_markdown_report(
+        ica_details, 
+        username, 
+        stored_filename, 
+        start_time, 
+        end_time,
+        analysis_comparison_section
+    )
+    
+    # Return markdown report
+    return Response(
+        content=report,
+        media_type="text/markdown",
+        headers={
+            "Content-Disposition": f"attachment; filename=ica_report_{username}_{start_time}s_to_{end_time}s.md"
+        }
+    )
+
+
+# Pipeline outputs for stored uploads keyed by content hash, so repeated ICA and
+# comparison reports over different time ranges don't re-run filters + ICA.
+_PIPELINE_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_PIPELINE_CACHE_MAXSIZE = 8
+_PIPELINE_CACHE_LOCK = threading.Lock()
+# Rendered comparison sections and report bodies (by requested times) and window
+# analyses (by sample range) kept per upload
+_PIPELINE_SECTIONS_MAXSIZE = 64
+
+
+def _cached_pipeline(file_hash: str) -> Optional[dict]:
+    """The cached pipeline entry for an upload, if there is one."""
+    with _PIPELINE_CACHE_LOCK:
+        entry = _PIPELINE_CACHE.get(file_hash)
+        if entry is not None:
+            _PIPELINE_CACHE.move_to_end(file_hash)
+        return entry
+
+
+def _pipeline_outputs(file_hash: str, data) -> dict:
+    """
+    Cached pipeline outputs for an upload: the parsed 'data', its 'cleaned_data',
+    rendered comparison 'sections' and comparison report bodies ('reports'), per-window
+    'windows' analyses, plus 'ica_details' (whole-record ICA statistics) once the ICA
+    report has computed them.
+    """
+    entry = _cached_pipeline(file_hash)
+    if entry is not None:
+        return entry
+
+    entry = {
+        'data': data,
+        'cleaned_data': _report_cleaner().clean(data),
+        'sections': OrderedDict(),
+        'reports': OrderedDict(),
+        'windows': OrderedDict()
+    }
+    with _PIPELINE_CACHE_LOCK:
+        entry = _PIPELINE_CACHE.setdefault(file_hash, entry)
+        _PIPELINE_CACHE.move_to_end(file_hash)
+        if len(_PIPELINE_CACHE) > _PIPELINE_CACHE_MAXSIZE:
+            _PIPELINE_CACHE.popitem(last=False)
+    return entry
+
+
+def _comparison_section(pipeline: dict, start_time: Optional[float], end_time: Optional[float]):
+    """
+    Rendered analysis comparison section and its time_range_info for a window of
+    a cached upload. The result only depends on the upload and the window, so it
+    is memoised on the upload's pipeline entry.
+    """
+    key = (start_time, end_time)
+    with _PIPELINE_CACHE_LOCK:
+        cached = pipeline['sections'].get(key)
+    if cached is not None:
+        return cached
+
+    raw_analysis, cleaned_analysis, _, _, time_range_info = _perform_analysis_comparison(
+        pipeline['data'], start_time, end_time,
+        cleaned_data=pipeline['cleaned_data'],
+        window_cache=pipeline['windows']
+    )
+    cached = (
+        _generate_analysis_comparison_section(raw_analysis, cleaned_analysis, time_range_info),
+        time_range_info
+    )
+    with _PIPELINE_CACHE_LOCK:
+        pipeline['sections'][key] = cached
+        if len(pipeline['sections']) > _PIPELINE_SECTIONS_MAXSIZE:
+            pipeline['sections'].popitem(last=False)
+    return cached
+
+
+def _comparison_report_body(pipeline: dict, start_time: Optional[float], end_time: Optional[float]) -> str:
+    """
+    Rendered analysis comparison report body for a window of a cached upload,
+    memoised on the pipeline entry alongside the section it embeds.
+    """
+    key = (start_time, end_time)
+    with _PIPELINE_CACHE_LOCK:
+        body = pipeline['reports'].get(key)
+    if body is not None:
+        return body
+
+    analysis_comparison_section, time_range_info = _comparison_section(pipeline, start_time, end_time)
+    body = _analysis_comparison_report_body(analysis_comparison_section, time_range_info, _report_cleaner().fs)
+    with _PIPELINE_CACHE_LOCK:
+        pipeline['reports'][key] = body
+        if len(pipeline['reports']) > _PIPELINE_SECTIONS_MAXSIZE:
+            pipeline['reports'].popitem(last=False)
+    return body
+
+
+def _analyze_window(analyzer: EEGAnalyzer, raw_range, cleaned_range):
+    """Pre-cleaning and post-cleaning analyses of one time window. Returns (raw_analysis, cleaned_analysis)."""
+    # Analyze pre-cleaning (raw) data for the time range
+    raw_band_powers = analyzer._analyze_frequency_bands(raw_range)
+    raw_dominant = analyzer._get_dominant_band(raw_band_powers)
+    raw_patterns = analyzer._identify_patterns(raw_range, raw_band_powers)
+    raw_indicators = analyzer._assess_clinical_indicators(raw_band_powers, raw_dominant)
+    raw_artefacts = analyzer._detect_remaining_artefacts(raw_range)
+    
+    raw_analysis = {
+        'snr_improvement': 0.0,
+        'noise_reduction': 0.0,
+        'band_powers': raw_band_powers,
+        'dominant_band': raw_dominant,
+        'patterns': raw_patterns,
+        'indicators': raw_indicators,
+        'artefacts_detected': raw_artefacts
+    }
+    
+    # Analyze post-cleaning data (comparing raw to cleaned for the time range)
+    cleaned_analysis = analyzer.analyze(raw_range, cleaned_range)
+    
+    return raw_analysis, cleaned_analysis
+
+
+def _perform_analysis_comparison(
+    data,
+    start_time: float = None,
+    end_time: float = None,
+    cleaned_data=None,
+    window_cache: Optional[OrderedDict] = None
+):
     """
     Shared function to perform pre-cleaning vs post-cleaning analysis comparison.
     
@@ -1097,22 +1771,24 @@ def _perform_analysis_comparison(data, start_time: float = None, end_time: float
         data: Raw EEG data
         start_time: Optional start time in seconds (if None, uses entire dataset)
         end_time: Optional end time in seconds (if None, uses entire dataset)
+        cleaned_data: Already-cleaned data for `data` (if None, runs the cleaning pipeline)
+        window_cache: Optional memo of analyses by (start_sample, end_sample) for this data
     
     Returns:
         Tuple of (raw_analysis, cleaned_analysis, cleaned_data, fs, time_range_info)
     """
-    # Create a new agent instance
-    request_agent = MindTraceAgent(config)
-    request_agent.load_data(data)
+    cleaner = _report_cleaner()
+    analyzer = _report_analyzer()
     
-    fs = request_agent.cleaner.fs
+    fs = cleaner.fs
     raw_data_arr = np.asarray(data)
     
-    # Determine time range
-    if raw_data_arr.ndim == 1:
-        num_samples_total = len(raw_data_arr)
+    # Determine time range; the longer axis of 2-D data is time
+    if raw_data_arr.ndim == 1 or raw_data_arr.shape[0] > raw_data_arr.shape[1]:
+        time_axis = 0
     else:
-        num_samples_total = raw_data_arr.shape[0] if raw_data_arr.shape[0] > raw_data_arr.shape[1] else raw_data_arr.shape[1]
+        time_axis = 1
+    num_samples_total = raw_data_arr.shape[time_axis]
     
     total_duration = num_samples_total / fs
     
@@ -1132,50 +1808,31 @@ def _perform_analysis_comparison(data, start_time: float = None, end_time: float
     start_idx = max(0, min(start_idx, num_samples_total - 1))
     end_idx = max(start_idx + 1, min(end_idx, num_samples_total))
     
-    if raw_data_arr.ndim == 1:
-        raw_range = raw_data_arr[start_idx:end_idx]
-    else:
-        if raw_data_arr.shape[0] > raw_data_arr.shape[1]:
-            raw_range = raw_data_arr[start_idx:end_idx, :]
-        else:
-            raw_range = raw_data_arr[:, start_idx:end_idx]
+    # One index tuple for both raw and cleaned data (same shape), so both ranges are views
+    window = [slice(None)] * raw_data_arr.ndim
+    window[time_axis] = slice(start_idx, end_idx)
+    window = tuple(window)
+    raw_range = raw_data_arr[window]
     
-    # Run full cleaning pipeline on entire dataset
-    request_agent.initial_clean()
-    cleaned_data = request_agent.cleaned_data
+    # Run full cleaning pipeline on entire dataset, unless the caller already has it
+    if cleaned_data is None:
+        cleaned_data = cleaner.clean(data)
     
     # Extract same time range from cleaned data
-    cleaned_data_arr = np.asarray(cleaned_data)
-    if cleaned_data_arr.ndim == 1:
-        cleaned_range = cleaned_data_arr[start_idx:end_idx]
-    else:
-        if cleaned_data_arr.shape[0] > cleaned_data_arr.shape[1]:
-            cleaned_range = cleaned_data_arr[start_idx:end_idx, :]
-        else:
-            cleaned_range = cleaned_data_arr[:, start_idx:end_idx]
-    
-    # Analyze pre-cleaning (raw) data for the time range
-    from mindtrace.processing.analyzer import EEGAnalyzer
-    temp_analyzer = EEGAnalyzer(fs)
-    
-    raw_band_powers = temp_analyzer._analyze_frequency_bands(raw_range)
-    raw_dominant = temp_analyzer._get_dominant_band(raw_band_powers)
-    raw_patterns = temp_analyzer._identify_patterns(raw_range, raw_band_powers)
-    raw_indicators = temp_analyzer._assess_clinical_indicators(raw_band_powers, raw_dominant)
-    raw_artefacts = temp_analyzer._detect_remaining_artefacts(raw_range)
-    
-    raw_analysis = {
-        'snr_improvement': 0.0,
-        'noise_reduction': 0.0,
-        'band_powers': raw_band_powers,
-        'dominant_band': raw_dominant,
-        'patterns': raw_patterns,
-        'indicators': raw_indicators,
-        'artefacts_detected': raw_artefacts
-    }
+    cleaned_range = np.asarray(cleaned_data)[window]
     
-    # Analyze post-cleaning data (comparing raw to cleaned for the time range)
-    cleaned_analysis = request_agent.analyzer.analyze(raw_range, cleaned_range)
+    # The analyses only depend on the sample window, so different start/end
+    # times that land on the same samples reuse them
+    window_key = (start_idx, end_idx)
+    analyses = window_cache.get(window_key) if window_cache is not None else None
+    if analyses is None:
+        analyses = _analyze_window(analyzer, raw_range, cleaned_range)
+        if window_cache is not None:
+            with _PIPELINE_CACHE_LOCK:
+                window_cache[window_key] = analyses
+                if len(window_cache) > _PIPELINE_SECTIONS_MAXSIZE:
+                    window_cache.popitem(last=False)
+    raw_analysis, cleaned_analysis = analyses
     
     time_range_info = {
         'start_time': start_time,
@@ -1229,7 +1886,7 @@ async def get_analysis_comparison(username: str, start_time: Optional[float] = N
     
     try:
         # Retrieve file from database
-        upload_record = db.get_user_upload(username)
+        upload_record = await asyncio.to_thread(db.get_user_upload, username)
         
         if upload_record is None:
             return Response(
@@ -1238,70 +1895,8 @@ async def get_analysis_comparison(username: str, start_time: Optional[float] = N
                 media_type="text/plain"
             )
         
-        # Get file data from database
-        file_data = upload_record['file_data']
-        stored_filename = upload_record['filename']
-        
-        # Save to temporary file for processing
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp:
-            tmp.write(file_data)
-            tmp_path = tmp.name
-        
-        try:
-            # Load data
-            try:
-                data = loader.load_file(tmp_path)
-            except Exception as exc:
-                return Response(
-                    content=f"Error: Failed to load data file: {exc}",
-                    status_code=400,
-                    media_type="text/plain"
-                )
-            
-            # Perform analysis comparison
-            raw_analysis, cleaned_analysis, cleaned_data, fs, time_range_info = _perform_analysis_comparison(
-                data, start_time, end_time
-            )
-            
-            # Generate analysis comparison section
-            analysis_comparison_section = _generate_analysis_comparison_section(
-                raw_analysis,
-                cleaned_analysis,
-                time_range_info
-            )
-            
-            # Generate full report
-            report = _generate_analysis_comparison_report(
-                analysis_comparison_section,
-                username,
-                stored_filename,
-                time_range_info,
-                fs
-            )
-            
-            # Determine filename
-            if start_time is not None and end_time is not None:
-                filename_suffix = f"{username}_{start_time}s_to_{end_time}s"
-            else:
-                filename_suffix = username
-            
-            # Return markdown report
-            return Response(
-                content=report,
-                media_type="text/markdown",
-                headers={
-                    "Content-Disposition": f"attachment; filename=analysis_comparison_{filename_suffix}.md"
-                }
-            )
-        
-        finally:
-            # Clean up temporary file
-            try:
-                import os
-                os.unlink(tmp_path)
-            except:
-                pass
+        # Parsing, cleaning and report generation are CPU-bound
+        return await asyncio.to_thread(_build_analysis_comparison_response, upload_record, username, start_time, end_time)
         
     except Exception as e:
         import traceback
@@ -1313,6 +1908,131 @@ async def get_analysis_comparison(username: str, start_time: Optional[float] = N
         )
 
 
+def _build_analysis_comparison_response(upload_record: dict, username: str, start_time: Optional[float], end_time: Optional[float]) -> Response:
+    """Load a stored upload and build the analysis comparison response (blocking; run off the event loop)."""
+    # Get file data from the stored upload
+    file_data = upload_record['file_data']
+    stored_filename = upload_record['filename']
+    file_hash = upload_record.get('file_hash') or hashlib.sha256(file_data).hexdigest()
+    
+    # Uploads already in the pipeline cache aren't parsed (or cleaned) again
+    pipeline = _cached_pipeline(file_hash)
+    if pipeline is None:
+        # Parse the stored contents directly; no temporary file round-trip
+        try:
+            data = loader.load_bytes(file_data, os.path.splitext(stored_filename)[1])
+        except Exception as exc:
+            return Response(
+                content=f"Error: Failed to load data file: {exc}",
+                status_code=400,
+                media_type="text/plain"
+            )
+        pipeline = _pipeline_outputs(file_hash, data)
+    
+    # Perform analysis comparison and generate its section
+    analysis_comparison_section, time_range_info = _comparison_section(pipeline, start_time, end_time)
+    
+    # Generate full report; only the header is rendered per request
+    report = _generate_analysis_comparison_report(
+        analysis_comparison_section,
+        username,
+        stored_filename,
+        time_range_info,
+        _report_cleaner().fs,
+        report_body=_comparison_report_body(pipeline, start_time, end_time)
+    )
+    
+    # Determine filename
+    if start_time is not None and end_time is not None:
+        filename_suffix = f"{username}_{start_time}s_to_{end_time}s"
+    else:
+        filename_suffix = username
+    
+    # Return markdown report
+    return Response(
+        content=report,
+        media_type="text/markdown",
+        headers={
+            "Content-Disposition": f"attachment; filename=analysis_comparison_{filename_suffix}.md"
+        }
+    )
+
+
+# Static "Technical Details" footers for the markdown reports, joined once at import
+_PIPELINE_TECHNICAL_DETAILS = "\n".join([
+    "\n---\n",
+    "## Technical Details\n",
+    "### Cleaning Pipeline\n",
+    "- **Bandpass Filter:** Removes frequencies outside the 1-40 Hz range",
+    "- **Notch Filter:** Removes 50 Hz line noise",
+    "- **ICA (Independent Component Analysis):** Removes artefact components with unusually high amplitude",
+    "- **Reconstruction:** Cleaned signal is reconstructed from retained components\n",
+    "### Analysis Methods\n",
+    "- **Frequency Analysis:** Power spectral density using Welch's method",
+    "- **Pattern Detection:** Heuristic-based pattern identification",
+    "- **Clinical Indicators:** Basic clinical interpretation based on frequency patterns",
+    "- **Artefact Detection:** Threshold-based detection of remaining artefacts\n"
+])
+
+_ICA_TECHNICAL_DETAILS = "\n".join([
+    "\n---\n",
+    "## Technical Details\n",
+    "### ICA Processing Method\n",
+    "- **Algorithm:** FastICA (sklearn.decomposition.FastICA)",
+    "- **Component Selection:** Components with peak-to-peak amplitude > 3x median are removed",
+    "- **Reconstruction:** Cleaned signal is reconstructed using inverse transform of retained components\n",
+    "### Interpretation\n",
+    "- **Removed Components:** Typically represent non-brain signals (artefacts)",
+    "- **Retained Components:** Represent brain activity and other valid signal sources",
+    "- **Threshold:** 3x median provides a robust heuristic for artefact detection\n"
+])
+
+# Row templates for the report tables
+_BAND_ROW_FORMAT = "| %s | %.2f%% | %.2f%% | %+.2f%% | %s |"
+_COMPONENT_ROW_FORMAT = "| %s | %s | %.4f | %.4f | %.4f | %s |"
+
+# "Dataset Information" block of the comparison report, for the entire dataset or a
+# time range; filled from time_range_info plus the sampling rate
+_DATASET_FULL_FORMAT = (
+    "- **Total Duration:** {total_duration:.2f} seconds\n"
+    "- **Total Samples:** {total_samples:,}\n"
+    "- **Sampling Rate:** {sampling_rate} Hz\n"
+    "- **Analysis Scope:** Entire dataset\n"
+)
+_DATASET_RANGE_FORMAT = (
+    "- **Time Range:** {start_time:.3f}s - {end_time:.3f}s\n"
+    "- **Duration:** {duration:.3f} seconds\n"
+    "- **Samples:** {num_samples:,}\n"
+    "- **Total Dataset Duration:** {total_duration:.2f} seconds\n"
+    "- **Total Dataset Samples:** {total_samples:,}\n"
+    "- **Sampling Rate:** {sampling_rate} Hz\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _format_report_second(second: int) -> str:
+    return datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _report_timestamp() -> str:
+    """'Generated' timestamp for the reports, formatted once per wall-clock second."""
+    return _format_report_second(int(time.time()))
+
+
+def _band_change_interpretation(change: float) -> str:
+    """Interpretation column for a band's pre/post-cleaning power change (percentage points)."""
+    if abs(change) < 2:
+        return "Minimal change"
+    if change > 0:
+        return f"Power increased by {change:.1f}% (noise removal may have revealed signal)"
+    return f"Power decreased by {abs(change):.1f}% (artefact removal)"
+
+
+def _format_indicator(indicator: dict) -> str:
+    """Bullet line for one clinical indicator from EEGAnalyzer."""
+    return f"- **{indicator.get('type', 'unknown').upper()}:** {indicator.get('description', '')}"
+
+
 def _generate_analysis_comparison_section(
     raw_analysis: dict,
     cleaned_analysis: dict,
@@ -1355,23 +2075,17 @@ def _generate_analysis_comparison_section(
             "|------|--------------|---------------|--------|----------------|"
         ])
         
-        band_names = ['delta', 'theta', 'alpha', 'beta', 'gamma']
-        band_labels = ['Delta (δ)', 'Theta (θ)', 'Alpha (α)', 'Beta (β)', 'Gamma (γ)']
-        
-        for band_name, band_label in zip(band_names, band_labels):
-            raw_power = raw_bands.get(band_name, 0)
-            cleaned_power = cleaned_bands.get(band_name, 0)
+        raw_get, cleaned_get = raw_bands.get, cleaned_bands.get
+        for band_name, band_label in zip(_BAND_KEYS, _BAND_LABELS):
+            # Bands missing from both analyses get no row
+            if band_name not in raw_bands and band_name not in cleaned_bands:
+                continue
+            raw_power = raw_get(band_name, 0)
+            cleaned_power = cleaned_get(band_name, 0)
             change = cleaned_power - raw_power
-            
-            # Interpretation
-            if abs(change) < 2:
-                interp = "Minimal change"
-            elif change > 0:
-                interp = f"Power increased by {change:.1f}% (noise removal may have revealed signal)"
-            else:
-                interp = f"Power decreased by {abs(change):.1f}% (artefact removal)"
-            
-            report_lines.append(f"| {band_label} | {raw_power:.2f}% | {cleaned_power:.2f}% | {change:+.2f}% | {interp} |")
+            report_lines.append(
+                _BAND_ROW_FORMAT % (band_label, raw_power, cleaned_power, change, _band_change_interpretation(change))
+            )
         
         # Dominant Band Comparison
         raw_dominant = raw_analysis.get('dominant_band', 'unknown')
@@ -1379,8 +2093,8 @@ def _generate_analysis_comparison_section(
         
         report_lines.extend([
             "\n### Dominant Frequency Band\n",
-            f"- **Pre-Cleaning:** {raw_dominant.capitalize()} ({raw_bands.get(raw_dominant, 0):.2f}% of total power)",
-            f"- **Post-Cleaning:** {cleaned_dominant.capitalize()} ({cleaned_bands.get(cleaned_dominant, 0):.2f}% of total power)"
+            f"- **Pre-Cleaning:** {raw_dominant.capitalize()} ({raw_get(raw_dominant, 0):.2f}% of total power)",
+            f"- **Post-Cleaning:** {cleaned_dominant.capitalize()} ({cleaned_get(cleaned_dominant, 0):.2f}% of total power)"
         ])
         
         if raw_dominant != cleaned_dominant:
@@ -1400,10 +2114,14 @@ def _generate_analysis_comparison_section(
             f"- **Post-Cleaning Patterns:** {', '.join(cleaned_patterns) if cleaned_patterns else 'None detected'}"
         ])
         
-        if set(raw_patterns) != set(cleaned_patterns):
+        raw_pattern_set = frozenset(raw_patterns)
+        cleaned_pattern_set = frozenset(cleaned_patterns)
+        added = cleaned_pattern_set - raw_pattern_set
+        removed = raw_pattern_set - cleaned_pattern_set
+        patterns_changed = bool(added or removed)
+        
+        if patterns_changed:
             report_lines.append("- **Change:** Pattern detection changed after cleaning")
-            added = set(cleaned_patterns) - set(raw_patterns)
-            removed = set(raw_patterns) - set(cleaned_patterns)
             if added:
                 report_lines.append(f"  - New patterns revealed: {', '.join(added)}")
             if removed:
@@ -1421,15 +2139,13 @@ def _generate_analysis_comparison_section(
         ])
         
         if raw_indicators:
-            for ind in raw_indicators:
-                report_lines.append(f"- **{ind.get('type', 'unknown').upper()}:** {ind.get('description', '')}")
+            report_lines.extend(map(_format_indicator, raw_indicators))
         else:
             report_lines.append("- No significant indicators detected")
         
         report_lines.append("\n#### Post-Cleaning Indicators:")
         if cleaned_indicators:
-            for ind in cleaned_indicators:
-                report_lines.append(f"- **{ind.get('type', 'unknown').upper()}:** {ind.get('description', '')}")
+            report_lines.extend(map(_format_indicator, cleaned_indicators))
         else:
             report_lines.append("- No significant indicators detected")
         
@@ -1456,7 +2172,7 @@ def _generate_analysis_comparison_section(
         if abs(snr_change) > 1:
             changes.append(f"Signal quality improved by {snr_change:.2f} dB, making brain signals more distinguishable from noise")
         
-        if set(raw_patterns) != set(cleaned_patterns):
+        if patterns_changed:
             changes.append("Pattern detection improved, with artefact-related patterns removed and genuine brain patterns revealed")
         
         if len(changes) == 0:
@@ -1476,20 +2192,7 @@ def _generate_analysis_comparison_section(
             "resulting in a cleaner representation of brain activity that better reflects the underlying neural signals.\n"
         ])
     
-    report_lines.extend([
-        "\n---\n",
-        "## Technical Details\n",
-        "### Cleaning Pipeline\n",
-        "- **Bandpass Filter:** Removes frequencies outside the 1-40 Hz range",
-        "- **Notch Filter:** Removes 50 Hz line noise",
-        "- **ICA (Independent Component Analysis):** Removes artefact components with unusually high amplitude",
-        "- **Reconstruction:** Cleaned signal is reconstructed from retained components\n",
-        "### Analysis Methods\n",
-        "- **Frequency Analysis:** Power spectral density using Welch's method",
-        "- **Pattern Detection:** Heuristic-based pattern identification",
-        "- **Clinical Indicators:** Basic clinical interpretation based on frequency patterns",
-        "- **Artefact Detection:** Threshold-based detection of remaining artefacts\n"
-    ])
+    report_lines.append(_PIPELINE_TECHNICAL_DETAILS)
     
     return "\n".join(report_lines)
 
@@ -1507,271 +2210,127 @@ def _generate_ica_markdown_report(
     """
     time_range = ica_details.get('time_range')
     component_details = ica_details.get('component_details', [])
-    
-    report_lines = [
-        "# ICA Component Analysis Report\n",
-        f"**Generated for:** {username}",
-        f"**Source File:** {filename}",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
-        "---\n",
-        "## Time Range Analysis\n",
-    ]
+    components_removed = ica_details['components_removed']
     
     if time_range and isinstance(time_range, dict) and 'start_sample' in time_range:
-        report_lines.extend([
-            f"- **Start Time:** {start_time:.3f} seconds",
-            f"- **End Time:** {end_time:.3f} seconds",
-            f"- **Duration:** {time_range['duration_seconds']:.3f} seconds",
-            f"- **Start Sample Index:** {time_range['start_sample']:,}",
-            f"- **End Sample Index:** {time_range['end_sample']:,}",
-            f"- **Number of Samples:** {time_range['num_samples']:,}\n",
-        ])
+        time_range_block = f"""- **Start Time:** {start_time:.3f} seconds
+- **End Time:** {end_time:.3f} seconds
+- **Duration:** {time_range['duration_seconds']:.3f} seconds
+- **Start Sample Index:** {time_range['start_sample']:,}
+- **End Sample Index:** {time_range['end_sample']:,}
+- **Number of Samples:** {time_range['num_samples']:,}
+"""
     else:
-        report_lines.extend([
-            f"- **Start Time:** {start_time:.3f} seconds",
-            f"- **End Time:** {end_time:.3f} seconds",
-            f"- **Total Dataset Duration:** {ica_details['total_duration_seconds']:.3f} seconds",
-            f"- **Total Samples:** {ica_details['n_samples']:,}\n",
-        ])
-    
-    report_lines.extend([
-        "---\n",
-        "## ICA Processing Summary\n",
-        f"- **Total Components:** {ica_details['n_components']}",
-        f"- **Components Removed:** {len(ica_details['components_removed'])}",
-        f"- **Components Retained:** {len(ica_details['components_retained'])}",
-        f"- **Removal Threshold:** {ica_details['threshold']:.4f} (3x median peak-to-peak amplitude)\n",
-    ])
+        time_range_block = f"""- **Start Time:** {start_time:.3f} seconds
+- **End Time:** {end_time:.3f} seconds
+- **Total Dataset Duration:** {ica_details['total_duration_seconds']:.3f} seconds
+- **Total Samples:** {ica_details['n_samples']:,}
+"""
     
-    if ica_details['components_removed']:
-        report_lines.extend([
-            "### Removed Components\n",
-            f"The following {len(ica_details['components_removed'])} component(s) were removed due to unusually high amplitude, "
-            "which typically indicates artefacts such as eye blinks, muscle activity, or electrical noise:\n"
-        ])
-        for comp_id in ica_details['components_removed']:
-            comp_info = component_details[comp_id]
-            report_lines.append(f"- **Component {comp_id}**")
-            report_lines.append(f"  - Peak-to-Peak Amplitude: {comp_info['peak_to_peak']:.4f}")
-            report_lines.append(f"  - Mean Amplitude: {comp_info['mean_amplitude']:.4f}")
-            report_lines.append(f"  - Max Amplitude: {comp_info['max_amplitude']:.4f}")
-            report_lines.append(f"  - Reason: {comp_info['reason']}\n")
+    if components_removed:
+        removed_components = "\n".join(
+            f"""- **Component {comp_id}**
+  - Peak-to-Peak Amplitude: {component_details[comp_id]['peak_to_peak']:.4f}
+  - Mean Amplitude: {component_details[comp_id]['mean_amplitude']:.4f}
+  - Max Amplitude: {component_details[comp_id]['max_amplitude']:.4f}
+  - Reason: {component_details[comp_id]['reason']}
+"""
+            for comp_id in components_removed
+        )
+        removed_block = f"""### Removed Components
+
+The following {len(components_removed)} component(s) were removed due to unusually high amplitude, which typically indicates artefacts such as eye blinks, muscle activity, or electrical noise:
+
+{removed_components}"""
     else:
-        report_lines.append("### Removed Components\n")
-        report_lines.append("No components were removed. All components were within normal amplitude ranges.\n")
+        removed_block = """### Removed Components
+
+No components were removed. All components were within normal amplitude ranges.
+"""
     
-    report_lines.extend([
-        "---\n",
-        "## Detailed Component Analysis\n",
-        "### All Components\n",
+    component_table = "\n".join([
         "| Component ID | Status | Peak-to-Peak | Mean Amp | Max Amp | Reason |",
-        "|--------------|--------|--------------|----------|---------|--------|"
-    ])
-    
-    for comp_info in component_details:
-        status = "❌ Removed" if comp_info['removed'] else "✅ Retained"
-        report_lines.append(
-            f"| {comp_info['component_id']} | {status} | {comp_info['peak_to_peak']:.4f} | "
-            f"{comp_info['mean_amplitude']:.4f} | {comp_info['max_amplitude']:.4f} | {comp_info['reason']} |"
+        "|--------------|--------|--------------|----------|---------|--------|",
+        *(
+            _COMPONENT_ROW_FORMAT % (
+                comp_info['component_id'],
+                "❌ Removed" if comp_info['removed'] else "✅ Retained",
+                comp_info['peak_to_peak'],
+                comp_info['mean_amplitude'],
+                comp_info['max_amplitude'],
+                comp_info['reason']
+            )
+            for comp_info in component_details
         )
-    
-    report_lines.extend([
-        "\n---\n",
-        "## Data Points Affected\n",
-        "### Impact Analysis\n",
-        "ICA component removal affects the entire dataset uniformly. When a component is removed:\n",
-    ])
-    
-    if time_range:
-        report_lines.append(f"- **All {time_range['num_samples']:,} samples** in the specified time range are affected")
-    else:
-        report_lines.append(f"- **All {ica_details['n_samples']:,} samples** in the dataset are affected")
-    
-    report_lines.extend([
-        "- The removed component's contribution is zeroed out across all time points",
-        "- The cleaned signal is reconstructed from the remaining components\n",
-        "### Affected Time Points\n",
     ])
     
     if time_range:
-        report_lines.extend([
-            f"- **Start:** {start_time:.3f} seconds (sample {time_range['start_sample']:,})",
-            f"- **End:** {end_time:.3f} seconds (sample {time_range['end_sample']:,})",
-            f"- **Total Samples Affected:** {time_range['num_samples']:,} samples\n",
-        ])
-    else:
-        report_lines.extend([
-            f"- **Start:** {start_time:.3f} seconds",
-            f"- **End:** {end_time:.3f} seconds",
-            f"- **Note:** ICA component removal affects all samples uniformly across the entire dataset\n",
-        ])
-    
-    # Add analysis comparison section if provided
-    if analysis_comparison_section:
-        report_lines.extend([
-            "---\n",
-            analysis_comparison_section
-        ])
+        samples_affected = f"- **All {time_range['num_samples']:,} samples** in the specified time range are affected"
+        affected_time_points = f"""- **Start:** {start_time:.3f} seconds (sample {time_range['start_sample']:,})
+- **End:** {end_time:.3f} seconds (sample {time_range['end_sample']:,})
+- **Total Samples Affected:** {time_range['num_samples']:,} samples
+"""
     else:
-        # Fallback if no analysis comparison provided
-        report_lines.extend([
-            "---\n",
-            "## Pre-Cleaning vs Post-Cleaning Analysis Comparison\n",
-            "Analysis comparison not available for this time range.\n"
-        ])
-    
-    # Keep the old code as fallback (should not be reached if analysis_comparison_section is provided)
-    if False and raw_analysis and cleaned_analysis:
-        # Signal Quality Comparison
-        report_lines.extend([
-            "\n### Signal Quality Metrics\n",
-            "| Metric | Pre-Cleaning | Post-Cleaning | Change |",
-            "|--------|--------------|---------------|--------|"
-        ])
-        
-        raw_snr = raw_analysis.get('snr_improvement', 0)
-        cleaned_snr = cleaned_analysis.get('snr_improvement', 0)
-        snr_change = cleaned_snr - raw_snr
-        
-        raw_noise = raw_analysis.get('noise_reduction', 0)
-        cleaned_noise = cleaned_analysis.get('noise_reduction', 0)
-        noise_change = cleaned_noise - raw_noise
-        
-        report_lines.append(f"| SNR Improvement | {raw_snr:.2f} dB | {cleaned_snr:.2f} dB | {snr_change:+.2f} dB |")
-        report_lines.append(f"| Noise Reduction | {raw_noise:.2f}% | {cleaned_noise:.2f}% | {noise_change:+.2f}% |")
-        
-        # Frequency Band Comparison
-        raw_bands = raw_analysis.get('band_powers', {})
-        cleaned_bands = cleaned_analysis.get('band_powers', {})
-        
-        report_lines.extend([
-            "\n### Frequency Band Power Distribution\n",
-            "| Band | Pre-Cleaning | Post-Cleaning | Change | Interpretation |",
-            "|------|--------------|---------------|--------|----------------|"
-        ])
-        
-        band_names = ['delta', 'theta', 'alpha', 'beta', 'gamma']
-        band_labels = ['Delta (δ)', 'Theta (θ)', 'Alpha (α)', 'Beta (β)', 'Gamma (γ)']
-        
-        for band_name, band_label in zip(band_names, band_labels):
-            raw_power = raw_bands.get(band_name, 0)
-            cleaned_power = cleaned_bands.get(band_name, 0)
-            change = cleaned_power - raw_power
-            
-            # Interpretation
-            if abs(change) < 2:
-                interp = "Minimal change"
-            elif change > 0:
-                interp = f"Power increased by {change:.1f}% (noise removal may have revealed signal)"
-            else:
-                interp = f"Power decreased by {abs(change):.1f}% (artefact removal)"
-            
-            report_lines.append(f"| {band_label} | {raw_power:.2f}% | {cleaned_power:.2f}% | {change:+.2f}% | {interp} |")
-        
-        # Dominant Band Comparison
-        raw_dominant = raw_analysis.get('dominant_band', 'unknown')
-        cleaned_dominant = cleaned_analysis.get('dominant_band', 'unknown')
-        
-        report_lines.extend([
-            "\n### Dominant Frequency Band\n",
-            f"- **Pre-Cleaning:** {raw_dominant.capitalize()} ({raw_bands.get(raw_dominant, 0):.2f}% of total power)",
-            f"- **Post-Cleaning:** {cleaned_dominant.capitalize()} ({cleaned_bands.get(cleaned_dominant, 0):.2f}% of total power)"
-        ])
-        
-        if raw_dominant != cleaned_dominant:
-            report_lines.append(f"- **Change:** Dominant band shifted from {raw_dominant} to {cleaned_dominant}")
-            report_lines.append("  - This indicates that cleaning removed artefacts that were masking the true brain activity")
-        else:
-            report_lines.append("- **Change:** Dominant band remained the same")
-            report_lines.append("  - Cleaning preserved the fundamental brain rhythm while removing noise")
-        
-        # Pattern Comparison
-        raw_patterns = raw_analysis.get('patterns', [])
-        cleaned_patterns = cleaned_analysis.get('patterns', [])
-        
-        report_lines.extend([
-            "\n### Detected Patterns\n",
-            f"- **Pre-Cleaning Patterns:** {', '.join(raw_patterns) if raw_patterns else 'None detected'}",
-            f"- **Post-Cleaning Patterns:** {', '.join(cleaned_patterns) if cleaned_patterns else 'None detected'}"
-        ])
-        
-        if set(raw_patterns) != set(cleaned_patterns):
-            report_lines.append("- **Change:** Pattern detection changed after cleaning")
-            added = set(cleaned_patterns) - set(raw_patterns)
-            removed = set(raw_patterns) - set(cleaned_patterns)
-            if added:
-                report_lines.append(f"  - New patterns revealed: {', '.join(added)}")
-            if removed:
-                report_lines.append(f"  - Patterns removed (likely artefacts): {', '.join(removed)}")
-        
-        # Clinical Indicators Comparison
-        raw_indicators = raw_analysis.get('indicators', [])
-        cleaned_indicators = cleaned_analysis.get('indicators', [])
-        
-        report_lines.extend([
-            "\n### Clinical Indicators\n",
-            "#### Pre-Cleaning Indicators:"
-        ])
-        
-        if raw_indicators:
-            for ind in raw_indicators:
-                report_lines.append(f"- **{ind.get('type', 'unknown').upper()}:** {ind.get('description', '')}")
-        else:
-            report_lines.append("- No significant indicators detected")
-        
-        report_lines.append("\n#### Post-Cleaning Indicators:")
-        if cleaned_indicators:
-            for ind in cleaned_indicators:
-                report_lines.append(f"- **{ind.get('type', 'unknown').upper()}:** {ind.get('description', '')}")
-        else:
-            report_lines.append("- No significant indicators detected")
-        
-        # Artefact Detection
-        raw_artefacts = raw_analysis.get('artefacts_detected', 0)
-        cleaned_artefacts = cleaned_analysis.get('artefacts_detected', 0)
-        
-        report_lines.extend([
-            "\n### Artefact Detection\n",
-            f"- **Pre-Cleaning:** {raw_artefacts} artefact event(s) detected",
-            f"- **Post-Cleaning:** {cleaned_artefacts} artefact event(s) remaining",
-            f"- **Removed:** {raw_artefacts - cleaned_artefacts} artefact event(s) successfully removed"
-        ])
-        
-        # Summary of Interpretation Changes
-        report_lines.extend([
-            "\n### Summary: How Cleaning Changed Interpretation\n"
-        ])
-        
-        changes = []
-        if raw_dominant != cleaned_dominant:
-            changes.append(f"Dominant brain rhythm changed from {raw_dominant} to {cleaned_dominant}, revealing true brain activity")
-        
-        if abs(snr_change) > 1:
-            changes.append(f"Signal quality improved by {snr_change:.2f} dB, making brain signals more distinguishable from noise")
-        
-        if set(raw_patterns) != set(cleaned_patterns):
-            changes.append("Pattern detection improved, with artefact-related patterns removed and genuine brain patterns revealed")
-        
-        if len(changes) == 0:
-            changes.append("Cleaning preserved the fundamental characteristics while reducing noise and artefacts")
-        
-        for i, change in enumerate(changes, 1):
-            report_lines.append(f"{i}. {change}")
+        samples_affected = f"- **All {ica_details['n_samples']:,} samples** in the dataset are affected"
+        affected_time_points = f"""- **Start:** {start_time:.3f} seconds
+- **End:** {end_time:.3f} seconds
+- **Note:** ICA component removal affects all samples uniformly across the entire dataset
+"""
     
-    report_lines.extend([
-        "\n---\n",
-        "## Technical Details\n",
-        "### ICA Processing Method\n",
-        "- **Algorithm:** FastICA (sklearn.decomposition.FastICA)",
-        "- **Component Selection:** Components with peak-to-peak amplitude > 3x median are removed",
-        "- **Reconstruction:** Cleaned signal is reconstructed using inverse transform of retained components\n",
-        "### Interpretation\n",
-        "- **Removed Components:** Typically represent non-brain signals (artefacts)",
-        "- **Retained Components:** Represent brain activity and other valid signal sources",
-        "- **Threshold:** 3x median provides a robust heuristic for artefact detection\n"
-    ])
+    # Fallback if no analysis comparison provided
+    comparison_block = analysis_comparison_section or """## Pre-Cleaning vs Post-Cleaning Analysis Comparison
+
+Analysis comparison not available for this time range.
+"""
     
-    return "\n".join(report_lines)
+    return f"""# ICA Component Analysis Report
+
+**Generated for:** {username}
+**Source File:** {filename}
+**Generated:** {_report_timestamp()}
+
+---
+
+## Time Range Analysis
+
+{time_range_block}
+---
+
+## ICA Processing Summary
+
+- **Total Components:** {ica_details['n_components']}
+- **Components Removed:** {len(components_removed)}
+- **Components Retained:** {len(ica_details['components_retained'])}
+- **Removal Threshold:** {ica_details['threshold']:.4f} (3x median peak-to-peak amplitude)
+
+{removed_block}
+---
+
+## Detailed Component Analysis
+
+### All Components
+
+{component_table}
+
+---
+
+## Data Points Affected
+
+### Impact Analysis
+
+ICA component removal affects the entire dataset uniformly. When a component is removed:
+
+{samples_affected}
+- The removed component's contribution is zeroed out across all time points
+- The cleaned signal is reconstructed from the remaining components
+
+### Affected Time Points
+
+{affected_time_points}
+---
+
+{comparison_block}
+{_ICA_TECHNICAL_DETAILS}"""
 
 
 def _generate_analysis_comparison_report(
@@ -1779,54 +2338,47 @@ def _generate_analysis_comparison_report(
     username: str,
     filename: str,
     time_range_info: dict,
-    sampling_rate: float
+    sampling_rate: float,
+    report_body: str = None
 ) -> str:
     """
     Generate a full markdown report for analysis comparison (standalone endpoint).
+    A report_body from _analysis_comparison_report_body() for the same section is used as is.
     """
-    report_lines = [
-        "# Pre-Cleaning vs Post-Cleaning Analysis Comparison\n",
-        f"**Generated for:** {username}",
-        f"**Source File:** {filename}",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
-        "---\n",
-        "## Dataset Information\n"
-    ]
-    
-    if time_range_info['start_time'] == 0.0 and time_range_info['end_time'] == time_range_info['total_duration']:
-        # Entire dataset
-        report_lines.extend([
-            f"- **Total Duration:** {time_range_info['total_duration']:.2f} seconds",
-            f"- **Total Samples:** {time_range_info['total_samples']:,}",
-            f"- **Sampling Rate:** {sampling_rate} Hz",
-            f"- **Analysis Scope:** Entire dataset\n"
-        ])
-    else:
-        # Time range
-        report_lines.extend([
-            f"- **Time Range:** {time_range_info['start_time']:.3f}s - {time_range_info['end_time']:.3f}s",
-            f"- **Duration:** {time_range_info['duration']:.3f} seconds",
-            f"- **Samples:** {time_range_info['num_samples']:,}",
-            f"- **Total Dataset Duration:** {time_range_info['total_duration']:.2f} seconds",
-            f"- **Total Dataset Samples:** {time_range_info['total_samples']:,}",
-            f"- **Sampling Rate:** {sampling_rate} Hz\n"
-        ])
+    if report_body is None:
+        report_body = _analysis_comparison_report_body(analysis_comparison_section, time_range_info, sampling_rate)
     
-    report_lines.extend([
-        "---\n",
-        analysis_comparison_section,
-        "\n---\n",
-        "## Technical Details\n",
-        "### Cleaning Pipeline\n",
-        "- **Bandpass Filter:** Removes frequencies outside the 1-40 Hz range",
-        "- **Notch Filter:** Removes 50 Hz line noise",
-        "- **ICA (Independent Component Analysis):** Removes artefact components with unusually high amplitude",
-        "- **Reconstruction:** Cleaned signal is reconstructed from retained components\n",
-        "### Analysis Methods\n",
-        "- **Frequency Analysis:** Power spectral density using Welch's method",
-        "- **Pattern Detection:** Heuristic-based pattern identification",
-        "- **Clinical Indicators:** Basic clinical interpretation based on frequency patterns",
-        "- **Artefact Detection:** Threshold-based detection of remaining artefacts\n"
-    ])
+    return f"""# Pre-Cleaning vs Post-Cleaning Analysis Comparison
+
+**Generated for:** {username}
+**Source File:** {filename}
+**Generated:** {_report_timestamp()}
+
+---
+
+{report_body}"""
+
+
+def _analysis_comparison_report_body(
+    analysis_comparison_section: str,
+    time_range_info: dict,
+    sampling_rate: float
+) -> str:
+    """
+    Everything below the header of the analysis comparison report. It doesn't depend on
+    the user or the clock, so it can be cached per upload and window.
+    """
+    entire_dataset = (
+        time_range_info['start_time'] == 0.0
+        and time_range_info['end_time'] == time_range_info['total_duration']
+    )
+    template = _DATASET_FULL_FORMAT if entire_dataset else _DATASET_RANGE_FORMAT
+    dataset_information = template.format_map({**time_range_info, 'sampling_rate': sampling_rate})
     
-    return "\n".join(report_lines)
\ No newline at end of file
+    return f"""## Dataset Information
+
+{dataset_information}
+---
+
+{analysis_comparison_section}
+{_PIPELINE_TECHNICAL_DETAILS}"""
\ No newline at end of file